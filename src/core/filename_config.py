@@ -13,16 +13,31 @@ See: docs/specs/05_schema.md for schema definitions
 from __future__ import annotations
 
 import os
+import re
 from datetime import datetime
 from functools import lru_cache
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
 from src.core.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 logger = get_logger(__name__)
 
+# Matches zero-padded YYYY-MM-DD, YYYY/MM/DD and YYYYMMDD date strings
+_ISSUE_DATE_RE = re.compile(r"(\d{4})([-/]?)(\d{2})\2(\d{2})", re.ASCII)
+
+# Formats tried when the regex does not match, e.g. unpadded "2025/1/5"
+_ISSUE_DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y%m%d")
+
+# Deletion tables for _sanitize; control characters are removed only after
+# whitespace has been collapsed, so the two sets are applied separately
+_INVALID_CHARS_TABLE = str.maketrans("", "", '<>:"/\\|?*\x00')
+_CONTROL_CHARS_TABLE = str.maketrans("", "", "".join(map(chr, range(1, 0x20))))
+
 # Default configuration when no external config is available
 DEFAULT_CONFIG: dict[str, Any] = {
     "version": "1.0",
@@ -174,7 +189,7 @@ def get_config() -> FilenameConfig:
 
 
 def generate_filename_from_template(
-    schema_data: dict[str, Any],
+    schema_data: Mapping[str, Any],
     document_type: str,
     timestamp: datetime,
     original_filename: str | None = None,
@@ -219,14 +234,13 @@ def generate_filename_from_template(
         logger.warning("pattern_format_error", pattern=pattern, missing_key=str(e))
         # Fallback to simple naming
         doc_id = schema_data.get("document_id", "unknown")
-        date_str = timestamp.strftime("%Y%m%d")
-        filename = f"{_sanitize(str(doc_id))}_{date_str}.pdf"
+        filename = f"{_sanitize(str(doc_id))}_{timestamp:%Y%m%d}.pdf"
 
     return folder, filename
 
 
 def _extract_field_value(
-    schema_data: dict[str, Any],
+    schema_data: Mapping[str, Any],
     field_config: dict[str, Any],
     timestamp: datetime,
 ) -> str:
@@ -268,11 +282,18 @@ def _format_date(
         return value.strftime(date_format)
 
     if isinstance(value, str):
-        # Try parsing various date formats
-        for fmt in ["%Y-%m-%d", "%Y/%m/%d", "%Y%m%d"]:
+        # Zero-padded dates parse in a single match
+        match = _ISSUE_DATE_RE.fullmatch(value)
+        if match:
             try:
-                dt = datetime.strptime(value, fmt)
+                dt = datetime(int(match[1]), int(match[3]), int(match[4]))
                 return dt.strftime(date_format)
+            except ValueError:
+                pass
+
+        for fmt in _ISSUE_DATE_FORMATS:
+            try:
+                return datetime.strptime(value, fmt).strftime(date_format)
             except ValueError:
                 continue
 
@@ -291,21 +312,15 @@ def _format_date(
 def _sanitize(value: str, max_length: int = 50) -> str:
     """Sanitize string for use in filename."""
     # Remove invalid characters
-    invalid_chars = '<>:"/\\|?*\x00'
-    for char in invalid_chars:
-        value = value.replace(char, "")
+    value = value.translate(_INVALID_CHARS_TABLE)
 
     # Replace whitespace with underscore
     value = "_".join(value.split())
 
     # Remove control characters
-    value = "".join(c for c in value if ord(c) >= 32)
-
-    # Truncate
-    if len(value) > max_length:
-        value = value[:max_length]
+    value = value.translate(_CONTROL_CHARS_TABLE)
 
-    # Clean up trailing underscores
-    value = value.strip("_")
+    # Truncate and clean up trailing underscores
+    value = value[:max_length].strip("_")
 
     return value or "unknown"
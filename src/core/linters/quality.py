@@ -12,8 +12,12 @@ from typing import Any
 
 import yaml
 
+# libyaml C extension: ~10x faster than the pure-Python loader. Falls back to
+# the pure-Python SafeLoader when PyYAML was built without libyaml.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class QualityRule:
     """A single quality validation rule."""
 
@@ -26,7 +30,7 @@ class QualityRule:
     params: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QualityWarning:
     """A quality issue found during validation."""
 
@@ -37,7 +41,7 @@ class QualityWarning:
     severity: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QualityLinterResult:
     """Result of Quality Linter validation."""
 
@@ -88,7 +92,7 @@ class QualityLinter:
             return []
 
         with config_file.open(encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)  # nosec B506 # noqa: S506 - safe loader
 
         rules = []
         for rule_dict in config.get("rules", []):
@@ -213,14 +217,7 @@ class QualityLinter:
         if not company_name:
             return None
 
-        # Check cache first
-        if company_name in self._vendor_cache:
-            exists = self._vendor_cache[company_name]
-        else:
-            exists = self._query_vendor_master(company_name)
-            self._vendor_cache[company_name] = exists
-
-        if not exists:
+        if not self._check_vendor(company_name):
             return QualityWarning(
                 rule_id=rule.id,
                 rule_name=rule.name,
@@ -231,6 +228,22 @@ class QualityLinter:
 
         return None
 
+    def _check_vendor(self, company_name: str) -> bool:
+        """Check vendor existence, memoized in the per-linter cache.
+
+        Args:
+            company_name: Company name to look up
+
+        Returns:
+            True if vendor exists, False otherwise
+        """
+        if company_name in self._vendor_cache:
+            return self._vendor_cache[company_name]
+
+        exists = self._query_vendor_master(company_name)
+        self._vendor_cache[company_name] = exists
+        return exists
+
     def _check_range(self, rule: QualityRule, data: dict) -> QualityWarning | None:
         """Check value within expected range.
 
@@ -7,7 +7,7 @@ with adaptive multimodal and markdown-only strategies.
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from pydantic import BaseModel
@@ -180,6 +180,63 @@ Confidence:
 - 0.00-0.49: Unlikely match
 """
 
+# ============================================================
+# Prompt Sections
+# ============================================================
+
+# Static sections are built once at import; builders join them with the
+# per-call parts instead of re-formatting the multi-KB system prompts.
+
+_SCHEMA_HEADER = "\n\n## Required Schema\n"
+
+_MARKDOWN_HEADER = "\n\n## Document Content (Markdown)\n```markdown\n"
+
+_MARKDOWN_FOOTER = "\n```\n"
+
+_RETRY_HEADER = """
+## Previous Attempt (FAILED)
+The previous extraction was rejected. Analyze the errors and correct.
+
+### Previous Output
+```json
+"""
+
+_RETRY_ERRORS_HEADER = """
+```
+
+### Validation Errors
+"""
+
+_RETRY_INSTRUCTIONS = """
+
+### Instructions
+1. Identify WHY each error occurred
+2. Re-examine the document (especially the Image if provided)
+3. Provide corrected JSON addressing ALL errors
+"""
+
+_OUTPUT_SECTION = """
+## Output
+Return ONLY valid JSON. No markdown code fences. No explanations.
+"""
+
+
+def _document_sections(system: str, schema_desc: str, markdown: str) -> list[str]:
+    """Return the system, schema and document sections shared by all prompts."""
+    return [system, _SCHEMA_HEADER, schema_desc, _MARKDOWN_HEADER, markdown, _MARKDOWN_FOOTER]
+
+
+def _retry_sections(previous_attempt: dict[str, Any], errors: list[str]) -> list[str]:
+    """Return the failed-attempt sections used for self-correction."""
+    return [
+        _RETRY_HEADER,
+        json.dumps(previous_attempt, indent=2, ensure_ascii=False),
+        _RETRY_ERRORS_HEADER,
+        "\n".join(f"- {e}" for e in errors),
+        _RETRY_INSTRUCTIONS,
+    ]
+
+
 # ============================================================
 # Prompt Builder
 # ============================================================
@@ -230,43 +287,15 @@ def build_extraction_prompt(
     schema_desc = generate_schema_description(schema_class)
 
     # Build main prompt
-    prompt = f"""{system}
-
-## Required Schema
-{schema_desc}
-
-## Document Content (Markdown)
-```markdown
-{gemini_input.markdown}
-```
-"""
+    parts = _document_sections(system, schema_desc, gemini_input.markdown)
 
     # Add retry context if applicable
     if previous_attempts and errors:
-        prompt += f"""
-## Previous Attempt (FAILED)
-The previous extraction was rejected. Analyze the errors and correct.
-
-### Previous Output
-```json
-{json.dumps(previous_attempts[-1], indent=2, ensure_ascii=False)}
-```
-
-### Validation Errors
-{chr(10).join(f"- {e}" for e in errors)}
-
-### Instructions
-1. Identify WHY each error occurred
-2. Re-examine the document (especially the Image if provided)
-3. Provide corrected JSON addressing ALL errors
-"""
+        parts += _retry_sections(previous_attempts[-1], errors)
 
-    prompt += """
-## Output
-Return ONLY valid JSON. No markdown code fences. No explanations.
-"""
+    parts.append(_OUTPUT_SECTION)
 
-    return prompt
+    return "".join(parts)
 
 
 # ============================================================
@@ -313,46 +342,16 @@ def build_correction_prompt(
     schema_desc = generate_schema_description(schema_class)
 
     # Start prompt
-    prompt = f"""{system}
-
-## Required Schema
-{schema_desc}
-
-## Document Content (Markdown)
-```markdown
-{markdown}
-```
-
-## Previous Attempt (FAILED)
-The previous extraction was rejected. Analyze the errors and correct.
-
-### Previous Output
-```json
-{json.dumps(previous_attempts[-1], indent=2, ensure_ascii=False)}
-```
-
-### Validation Errors
-{chr(10).join(f"- {e}" for e in errors)}
-
-### Instructions
-1. Identify WHY each error occurred
-2. Re-examine the document (especially the Image if provided)
-3. Provide corrected JSON addressing ALL errors
-"""
+    parts = _document_sections(system, schema_desc, markdown)
+    parts += _retry_sections(previous_attempts[-1], errors)
 
     # Add escalation note if Pro model
     if escalation_note:
-        prompt += f"""
-### Escalation Note
-{escalation_note}
-"""
+        parts += ["\n### Escalation Note\n", escalation_note, "\n"]
 
-    prompt += """
-## Output
-Return ONLY valid JSON. No markdown code fences. No explanations.
-"""
+    parts.append(_OUTPUT_SECTION)
 
-    return prompt
+    return "".join(parts)
 
 
 def build_initial_prompt(
@@ -385,18 +384,7 @@ def build_initial_prompt(
     # Build schema description
     schema_desc = generate_schema_description(schema_class)
 
-    prompt = f"""{system}
-
-## Required Schema
-{schema_desc}
-
-## Document Content (Markdown)
-```markdown
-{markdown}
-```
-
-## Output
-Return ONLY valid JSON. No markdown code fences. No explanations.
-"""
+    parts = _document_sections(system, schema_desc, markdown)
+    parts.append(_OUTPUT_SECTION)
 
-    return prompt
+    return "".join(parts)
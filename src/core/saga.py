@@ -98,8 +98,8 @@ class SagaOrchestrator:
         ])
 
     Thread Safety:
-        Each instance should be used for a single execution.
-        Create a new instance for each saga execution.
+        execute() resets per-run state, so an instance may be reused for
+        sequential executions. Do not share an instance across threads.
     """
 
     def __init__(self) -> None:
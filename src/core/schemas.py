@@ -8,6 +8,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from functools import cache
 
 from pydantic import BaseModel, Field
 
@@ -422,6 +423,9 @@ def list_schemas() -> dict[str, dict]:
 def generate_schema_description(schema_class: type[BaseModel]) -> str:
     """Generate human-readable schema description for Gemini prompts.
 
+    Schema classes are immutable after definition, so the description is
+    rendered once per class and reused by every prompt build and retry.
+
     Args:
         schema_class: Pydantic model class
 
@@ -437,6 +441,12 @@ def generate_schema_description(schema_class: type[BaseModel]) -> str:
           - Type: `<class 'str'>`
         ...
     """
+    return _describe_schema(schema_class)
+
+
+@cache
+def _describe_schema(schema_class: type[BaseModel]) -> str:
+    """Render the description for one schema class, cached per class."""
     lines = [f"## {schema_class.__name__}", ""]
 
     for field_name, field_info in schema_class.model_fields.items():
@@ -10,12 +10,16 @@ See: docs/specs/03_saga.md
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+
     from google.api_core import retry
     from google.api_core.exceptions import GoogleAPIError, NotFound
     from google.cloud import storage
@@ -56,16 +60,33 @@ DEFAULT_RETRY = retry.Retry(
     deadline=300.0,
 )
 
+# Worker threads for batch operations; each GCS call is latency-bound
+BATCH_MAX_WORKERS = 8
+
+# gs://bucket/blob with a non-empty bucket and blob; DOTALL so blob names
+# containing newlines match like any other character
+_GCS_PATH_RE = re.compile(r"gs://(?P<bucket>[^/]+)/(?P<blob>.+)", re.DOTALL)
+
+# Filename sanitization: invalid and control characters map to "_"
+_INVALID_FILENAME_CHARS = '<>:"/\\|?*' + "".join(map(chr, range(0x20))) + "\x7f"
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys(_INVALID_FILENAME_CHARS, "_"))
+_ASCII_SANITIZE_TABLE = bytes(
+    ord("_") if chr(b) in _INVALID_FILENAME_CHARS else b for b in range(256)
+)
+_MULTI_UNDERSCORE_RE = re.compile(r"_+")
+
 
 class StorageError(Exception):
     """Base exception for storage operations."""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidGCSPathError(StorageError):
     """Raised when a GCS path is malformed."""
 
+    __slots__ = ("path", "reason")
+
     def __init__(self, path: str, reason: str = "") -> None:
         self.path = path
         self.reason = reason
@@ -74,19 +95,51 @@ class InvalidGCSPathError(StorageError):
             message += f" ({reason})"
         super().__init__(message)
 
+    def __reduce__(self) -> tuple[type[InvalidGCSPathError], tuple[str, str]]:
+        # Slot attributes are not pickled; rebuild from the constructor args
+        return type(self), (self.path, self.reason)
+
 
 class FileNotFoundError(StorageError):
     """Raised when a file is not found in GCS."""
 
+    __slots__ = ("path",)
+
     def __init__(self, path: str) -> None:
         self.path = path
         super().__init__(f"File not found: {path}")
 
+    def __reduce__(self) -> tuple[type[FileNotFoundError], tuple[str]]:
+        return type(self), (self.path,)
+
+
+def _get_bucket(
+    client: storage.Client,
+    bucket_name: str,
+    buckets: dict[str, storage.Bucket] | None = None,
+) -> storage.Bucket:
+    """
+    Return a bucket handle for client, reusing one from buckets if given.
+
+    buckets must only ever be used with the same client; StorageClient keeps
+    one per instance and batch operations keep one per call.
+    """
+    if buckets is None:
+        return client.bucket(bucket_name)
+    bucket = buckets.get(bucket_name)
+    if bucket is None:
+        bucket = buckets[bucket_name] = client.bucket(bucket_name)
+    return bucket
+
 
+@lru_cache(maxsize=1024)
 def parse_gcs_path(path: str) -> tuple[str, str]:
     """
     Parse a GCS URI into bucket name and blob path.
 
+    Results are cached since the same URIs are parsed repeatedly across
+    saga steps; invalid paths raise and are never cached.
+
     Args:
         path: GCS URI in format gs://bucket/path/to/file
 
@@ -96,29 +149,27 @@ def parse_gcs_path(path: str) -> tuple[str, str]:
     Raises:
         InvalidGCSPathError: If path format is invalid
     """
+    match = _GCS_PATH_RE.fullmatch(path)
+    if match:
+        return match["bucket"], match["blob"]
+
+    # Invalid path: work out which rule it breaks for the error message
     if not path:
         raise InvalidGCSPathError(path, "empty path")
 
-    if not path.startswith("gs://"):
+    # Remove gs:// prefix; an unchanged length means it was missing
+    stripped = path.removeprefix("gs://")
+    if len(stripped) == len(path):
         raise InvalidGCSPathError(path, "must start with gs://")
 
-    # Remove gs:// prefix
-    stripped = path[5:]
-
-    if "/" not in stripped:
+    bucket_name, sep, _ = stripped.partition("/")
+    if not sep:
         raise InvalidGCSPathError(path, "missing blob path")
 
-    parts = stripped.split("/", 1)
-    bucket_name = parts[0]
-    blob_path = parts[1] if len(parts) > 1 else ""
-
     if not bucket_name:
         raise InvalidGCSPathError(path, "empty bucket name")
 
-    if not blob_path:
-        raise InvalidGCSPathError(path, "empty blob path")
-
-    return bucket_name, blob_path
+    raise InvalidGCSPathError(path, "empty blob path")
 
 
 def copy_blob(
@@ -126,6 +177,8 @@ def copy_blob(
     source_path: str,
     dest_path: str,
     retry_config: retry.Retry | None = None,
+    *,
+    buckets: dict[str, storage.Bucket] | None = None,
 ) -> None:
     """
     Copy a blob from source to destination.
@@ -137,6 +190,8 @@ def copy_blob(
         source_path: Source GCS URI (gs://bucket/path/to/source)
         dest_path: Destination GCS URI (gs://bucket/path/to/dest)
         retry_config: Optional retry configuration
+        buckets: Optional caller-owned dict of bucket handles by name,
+            reused across calls made with the same client
 
     Raises:
         FileNotFoundError: If source file does not exist
@@ -155,21 +210,22 @@ def copy_blob(
     )
 
     try:
-        source_bucket = client.bucket(source_bucket_name)
+        source_bucket = _get_bucket(client, source_bucket_name, buckets)
         source_blob = source_bucket.blob(source_blob_name)
 
         # Check source exists
         if not source_blob.exists():
             raise FileNotFoundError(source_path)
 
-        dest_bucket = client.bucket(dest_bucket_name)
+        dest_bucket = _get_bucket(client, dest_bucket_name, buckets)
         dest_blob = dest_bucket.blob(dest_blob_name)
 
         # Use rewrite for large files (handles >5GB automatically)
+        rewrite = dest_blob.rewrite
         rewrite_token = None
         while True:
-            rewrite_token, bytes_rewritten, total_bytes = dest_blob.rewrite(
-                source_blob, token=rewrite_token
+            rewrite_token, bytes_rewritten, total_bytes = rewrite(
+                source_blob, token=rewrite_token, retry=retry_config
             )
             if rewrite_token is None:
                 break
@@ -205,6 +261,8 @@ def delete_blob(
     path: str,
     ignore_not_found: bool = True,
     retry_config: retry.Retry | None = None,
+    *,
+    buckets: dict[str, storage.Bucket] | None = None,
 ) -> bool:
     """
     Delete a blob from GCS.
@@ -214,6 +272,8 @@ def delete_blob(
         path: GCS URI (gs://bucket/path/to/blob)
         ignore_not_found: If True, don't raise on missing blob
         retry_config: Optional retry configuration
+        buckets: Optional caller-owned dict of bucket handles by name,
+            reused across calls made with the same client
 
     Returns:
         True if file was deleted, False if not found (and ignore_not_found=True)
@@ -230,7 +290,7 @@ def delete_blob(
     logger.info("gcs_delete_starting", path=path)
 
     try:
-        bucket = client.bucket(bucket_name)
+        bucket = _get_bucket(client, bucket_name, buckets)
         blob = bucket.blob(blob_name)
         blob.delete(retry=retry_config)
 
@@ -252,23 +312,152 @@ def delete_blob(
         raise StorageError(f"Failed to delete {path}: {e}") from e
 
 
-def file_exists(client: storage.Client, path: str) -> bool:
+def _run_batch(
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    max_workers: int,
+) -> tuple[list[Any], dict[int, StorageError]]:
+    """Run func over items in a thread pool, collecting results and failures by index."""
+    results: list[Any] = [None] * len(items)
+    failures: dict[int, StorageError] = {}
+    if not items:
+        return results, failures
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        for index, future in enumerate(futures):
+            try:
+                results[index] = future.result()
+            except StorageError as e:
+                failures[index] = e
+
+    return results, failures
+
+
+def copy_blobs_batch(
+    client: storage.Client,
+    pairs: Sequence[tuple[str, str]],
+    max_workers: int = BATCH_MAX_WORKERS,
+    retry_config: retry.Retry | None = None,
+) -> None:
+    """
+    Copy multiple blobs concurrently.
+
+    Every copy is attempted even if some fail.
+
+    Args:
+        client: GCS storage client
+        pairs: (source_path, dest_path) GCS URI pairs
+        max_workers: Maximum number of concurrent copies
+        retry_config: Optional retry configuration
+
+    Raises:
+        StorageError: If any copy fails, listing each failed pair
+    """
+    buckets: dict[str, storage.Bucket] = {}
+    _, failures = _run_batch(
+        lambda pair: copy_blob(
+            client, pair[0], pair[1], retry_config=retry_config, buckets=buckets
+        ),
+        pairs,
+        max_workers,
+    )
+
+    logger.info("gcs_batch_copy_completed", total=len(pairs), failed=len(failures))
+
+    if failures:
+        details = "; ".join(
+            f"{pairs[i][0]} -> {pairs[i][1]}: {error}" for i, error in failures.items()
+        )
+        first_error = next(iter(failures.values()))
+        raise StorageError(
+            f"Failed to copy {len(failures)} of {len(pairs)} blobs: {details}"
+        ) from first_error
+
+
+def delete_blobs_batch(
+    client: storage.Client,
+    paths: Sequence[str],
+    ignore_not_found: bool = True,
+    max_workers: int = BATCH_MAX_WORKERS,
+    retry_config: retry.Retry | None = None,
+) -> list[bool]:
+    """
+    Delete multiple blobs concurrently.
+
+    Every delete is attempted even if some fail.
+
+    Args:
+        client: GCS storage client
+        paths: GCS URIs to delete
+        ignore_not_found: If True, don't treat missing blobs as failures
+        max_workers: Maximum number of concurrent deletes
+        retry_config: Optional retry configuration
+
+    Returns:
+        Per-path delete_blob results, in the order of paths
+
+    Raises:
+        StorageError: If any delete fails, listing each failed path
+    """
+    buckets: dict[str, storage.Bucket] = {}
+    results, failures = _run_batch(
+        lambda path: delete_blob(
+            client,
+            path,
+            ignore_not_found=ignore_not_found,
+            retry_config=retry_config,
+            buckets=buckets,
+        ),
+        paths,
+        max_workers,
+    )
+
+    logger.info("gcs_batch_delete_completed", total=len(paths), failed=len(failures))
+
+    if failures:
+        details = "; ".join(f"{paths[i]}: {error}" for i, error in failures.items())
+        first_error = next(iter(failures.values()))
+        raise StorageError(
+            f"Failed to delete {len(failures)} of {len(paths)} blobs: {details}"
+        ) from first_error
+
+    return results
+
+
+def file_exists(
+    client: storage.Client,
+    path: str,
+    *,
+    cache: dict[str, bool] | None = None,
+    buckets: dict[str, storage.Bucket] | None = None,
+) -> bool:
     """
     Check if a file exists in GCS.
 
     Args:
         client: GCS storage client
         path: GCS URI (gs://bucket/path/to/blob)
+        cache: Optional caller-owned dict memoizing results by path. The
+            caller is responsible for eviction; failed checks are not cached.
+        buckets: Optional caller-owned dict of bucket handles by name,
+            reused across calls made with the same client
 
     Returns:
         True if file exists, False otherwise
     """
+    if cache is not None and path in cache:
+        return cache[path]
+
     bucket_name, blob_name = parse_gcs_path(path)
 
     try:
-        bucket = client.bucket(bucket_name)
+        bucket = _get_bucket(client, bucket_name, buckets)
         blob = bucket.blob(blob_name)
-        return blob.exists()
+        exists = blob.exists()
+        if cache is not None:
+            cache[path] = exists
+        return exists
 
     except GoogleAPIError as e:
         logger.error(
@@ -281,7 +470,7 @@ def file_exists(client: storage.Client, path: str) -> bool:
 
 
 def generate_destination_path(
-    schema_data: dict[str, Any],
+    schema_data: Mapping[str, Any],
     timestamp: datetime,
     output_bucket: str,
     original_filename: str | None = None,
@@ -304,7 +493,6 @@ def generate_destination_path(
     from src.core.filename_config import generate_filename_from_template
 
     document_type = schema_data.get("document_type", "generic")
-    month_folder = timestamp.strftime("%Y%m")
 
     # Generate folder and filename from template
     subfolder, filename = generate_filename_from_template(
@@ -314,7 +502,7 @@ def generate_destination_path(
         original_filename=original_filename,
     )
 
-    return f"gs://{output_bucket}/{month_folder}/{subfolder}/{filename}"
+    return f"gs://{output_bucket}/{timestamp:%Y%m}/{subfolder}/{filename}"
 
 
 def _parse_date_string(issue_date: str | datetime | Any) -> str:
@@ -344,10 +532,14 @@ def _sanitize_filename(value: str, max_length: int = 50) -> str:
     """
     # Replace characters that are problematic in filenames
     # Keep alphanumeric, Japanese characters, hyphens, underscores
-    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", value)
+    try:
+        # Fast path for ASCII-only values such as management IDs
+        sanitized = value.encode("ascii").translate(_ASCII_SANITIZE_TABLE).decode("ascii")
+    except UnicodeEncodeError:
+        sanitized = value.translate(_SANITIZE_TABLE)
 
     # Replace multiple consecutive underscores
-    sanitized = re.sub(r"_+", "_", sanitized)
+    sanitized = _MULTI_UNDERSCORE_RE.sub("_", sanitized)
 
     # Strip whitespace and underscores from ends
     sanitized = sanitized.strip().strip("_")
@@ -362,17 +554,24 @@ def _sanitize_filename(value: str, max_length: int = 50) -> str:
 def upload_string(
     client: storage.Client,
     path: str,
-    content: str,
+    content: str | bytes,
     content_type: str = "text/plain",
+    *,
+    buckets: dict[str, storage.Bucket] | None = None,
 ) -> None:
     """
-    Upload a string as a blob.
+    Upload a string or bytes as a blob.
+
+    Bytes are passed through as-is, so already-encoded payloads (e.g.
+    serialized JSON) skip a decode/encode round trip.
 
     Args:
         client: GCS storage client
         path: GCS URI for destination
-        content: String content to upload
+        content: String (uploaded as UTF-8) or raw bytes to upload
         content_type: MIME type for the content
+        buckets: Optional caller-owned dict of bucket handles by name,
+            reused across calls made with the same client
     """
     bucket_name, blob_name = parse_gcs_path(path)
 
@@ -384,7 +583,7 @@ def upload_string(
     )
 
     try:
-        bucket = client.bucket(bucket_name)
+        bucket = _get_bucket(client, bucket_name, buckets)
         blob = bucket.blob(blob_name)
         blob.upload_from_string(content, content_type=content_type)
 
@@ -399,13 +598,20 @@ def upload_string(
         raise StorageError(f"Failed to upload to {path}: {e}") from e
 
 
-def download_as_bytes(client: storage.Client, path: str) -> bytes:
+def download_as_bytes(
+    client: storage.Client,
+    path: str,
+    *,
+    buckets: dict[str, storage.Bucket] | None = None,
+) -> bytes:
     """
     Download a blob as bytes.
 
     Args:
         client: GCS storage client
         path: GCS URI of the file
+        buckets: Optional caller-owned dict of bucket handles by name,
+            reused across calls made with the same client
 
     Returns:
         File content as bytes
@@ -419,7 +625,7 @@ def download_as_bytes(client: storage.Client, path: str) -> bytes:
     logger.info("gcs_download_starting", path=path)
 
     try:
-        bucket = client.bucket(bucket_name)
+        bucket = _get_bucket(client, bucket_name, buckets)
         blob = bucket.blob(blob_name)
 
         if not blob.exists():
@@ -445,14 +651,17 @@ def download_as_bytes(client: storage.Client, path: str) -> bytes:
         raise StorageError(f"Failed to download {path}: {e}") from e
 
 
-def list_blobs(
+def list_blobs_iter(
     client: storage.Client,
     bucket_name: str,
     prefix: str = "",
     max_results: int | None = None,
-) -> list[str]:
+) -> Iterator[str]:
     """
-    List blobs in a bucket with optional prefix filter.
+    Lazily yield blob names in a bucket with optional prefix filter.
+
+    Names are yielded as result pages arrive, so large prefixes can be
+    traversed without holding every name in memory.
 
     Args:
         client: GCS storage client
@@ -460,13 +669,16 @@ def list_blobs(
         prefix: Optional prefix to filter blobs
         max_results: Maximum number of results to return
 
-    Returns:
-        List of blob names (not full paths)
+    Yields:
+        Blob names (not full paths)
+
+    Raises:
+        StorageError: If listing fails
     """
     try:
-        bucket = client.bucket(bucket_name)
-        blobs = bucket.list_blobs(prefix=prefix, max_results=max_results)
-        return [blob.name for blob in blobs]
+        bucket = _get_bucket(client, bucket_name)
+        for blob in bucket.list_blobs(prefix=prefix, max_results=max_results):
+            yield blob.name
 
     except GoogleAPIError as e:
         logger.error(
@@ -478,6 +690,27 @@ def list_blobs(
         raise StorageError(f"Failed to list blobs in {bucket_name}: {e}") from e
 
 
+def list_blobs(
+    client: storage.Client,
+    bucket_name: str,
+    prefix: str = "",
+    max_results: int | None = None,
+) -> list[str]:
+    """
+    List blobs in a bucket with optional prefix filter.
+
+    Args:
+        client: GCS storage client
+        bucket_name: Name of the bucket
+        prefix: Optional prefix to filter blobs
+        max_results: Maximum number of results to return
+
+    Returns:
+        List of blob names (not full paths)
+    """
+    return list(list_blobs_iter(client, bucket_name, prefix, max_results))
+
+
 class StorageClient:
     """
     High-level storage client wrapping GCS operations.
@@ -493,27 +726,38 @@ class StorageClient:
             client: Optional GCS client. If not provided, creates a new one.
         """
         self._client = client or storage.Client()
+        # Bucket handles for this client only, dropped by close()
+        self._buckets: dict[str, storage.Bucket] = {}
 
     @property
     def client(self) -> storage.Client:
         """Get the underlying GCS client."""
         return self._client
 
+    def close(self) -> None:
+        """Release cached bucket handles.
+
+        The underlying GCS client is left open since it may be shared.
+        """
+        self._buckets.clear()
+
     def copy_file(self, source_uri: str, dest_uri: str) -> None:
         """Copy a file from source to destination."""
-        copy_blob(self._client, source_uri, dest_uri)
+        copy_blob(self._client, source_uri, dest_uri, buckets=self._buckets)
 
     def delete_file(self, uri: str, ignore_not_found: bool = True) -> bool:
         """Delete a file."""
-        return delete_blob(self._client, uri, ignore_not_found=ignore_not_found)
+        return delete_blob(
+            self._client, uri, ignore_not_found=ignore_not_found, buckets=self._buckets
+        )
 
-    def file_exists(self, uri: str) -> bool:
+    def file_exists(self, uri: str, *, cache: dict[str, bool] | None = None) -> bool:
         """Check if a file exists."""
-        return file_exists(self._client, uri)
+        return file_exists(self._client, uri, cache=cache, buckets=self._buckets)
 
     def generate_destination_path(
         self,
-        schema_data: dict[str, Any],
+        schema_data: Mapping[str, Any],
         timestamp: datetime,
         output_bucket: str,
         original_filename: str | None = None,
@@ -524,12 +768,12 @@ class StorageClient:
     def upload_string(
         self,
         uri: str,
-        content: str,
+        content: str | bytes,
         content_type: str = "text/plain",
     ) -> None:
-        """Upload a string as a blob."""
-        upload_string(self._client, uri, content, content_type)
+        """Upload a string or bytes as a blob."""
+        upload_string(self._client, uri, content, content_type, buckets=self._buckets)
 
     def download_as_bytes(self, uri: str) -> bytes:
         """Download a blob as bytes."""
-        return download_as_bytes(self._client, uri)
+        return download_as_bytes(self._client, uri, buckets=self._buckets)
@@ -0,0 +1,124 @@
+"""Unit test fixtures."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+# ============================================================
+# Google Cloud Stubs
+# ============================================================
+
+_GOOGLE_STUB_MODULES = (
+    "google.cloud",
+    "google.cloud.storage",
+    "google.api_core",
+    "google.api_core.retry",
+)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Install Google Cloud stubs once, before any unit test module is collected.
+
+    Lets src.core.storage import without google-cloud-storage. ``setdefault``
+    leaves real or previously installed modules alone, so re-collection does
+    not rebuild the stubs. Tests take the exception classes from
+    src.core.storage, which binds whichever NotFound/GoogleAPIError it
+    resolved at import.
+    """
+    for name in _GOOGLE_STUB_MODULES:
+        sys.modules.setdefault(name, Mock())
+
+    # Reuse exception classes that already exist so ``except``/``isinstance``
+    # keep matching; a Mock attribute is not a class and gets replaced.
+    exceptions = sys.modules.setdefault("google.api_core.exceptions", Mock())
+    for name in ("NotFound", "GoogleAPIError"):
+        if not isinstance(getattr(exceptions, name, None), type):
+            setattr(exceptions, name, type(name, (Exception,), {}))
+
+
+# ============================================================
+# Mock Clients
+# ============================================================
+
+# Attributes src.core.storage touches on each GCS object. ``spec_set`` keeps
+# the mocks from growing children for anything else and turns typos in tests
+# into AttributeError.
+_CLIENT_ATTRS = ("bucket",)
+_BUCKET_ATTRS = ("blob", "list_blobs")
+_BLOB_ATTRS = ("delete", "download_as_bytes", "exists", "name", "rewrite", "upload_from_string")
+
+
+def _client_mock() -> Mock:
+    return Mock(spec_set=_CLIENT_ATTRS)
+
+
+def _bucket_mock() -> Mock:
+    return Mock(spec_set=_BUCKET_ATTRS)
+
+
+def _blob_mock() -> Mock:
+    return Mock(spec_set=_BLOB_ATTRS)
+
+
+@pytest.fixture(scope="class")
+def _gcs_mock_tree() -> SimpleNamespace:
+    """Build the GCS client/bucket/blob mocks once per test class."""
+    return SimpleNamespace(client=_client_mock(), bucket=_bucket_mock(), blob=_blob_mock())
+
+
+@pytest.fixture
+def gcs_mocks(_gcs_mock_tree: SimpleNamespace) -> Iterator[SimpleNamespace]:
+    """Lightweight GCS client/bucket/blob chain.
+
+    Uses ``Mock`` limited by ``spec_set`` to the attributes storage code
+    touches, rather than ``MagicMock``. The mocks are shared across a test class
+    and reset after each test, so no configuration or call history leaks.
+
+    Yields:
+        Namespace with ``client``, ``bucket`` and ``blob`` where
+        ``client.bucket()`` returns ``bucket`` and ``bucket.blob()`` returns ``blob``
+    """
+    ns = _gcs_mock_tree
+    ns.client.bucket.return_value = ns.bucket
+    ns.bucket.blob.return_value = ns.blob
+    yield ns
+    for mock in (ns.client, ns.bucket, ns.blob):
+        mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def blob_chain() -> Callable[..., tuple[Mock, Mock, Mock]]:
+    """Factory for a source/destination chain used by copy tests.
+
+    Source and destination share one bucket mock whose ``blob()`` returns the
+    source blob first and the destination blob second, mirroring the call
+    order in ``copy_blob`` whether or not the bucket handle is cached.
+
+    Returns:
+        Function taking ``exists`` (source blob existence) and ``rewrite``
+        (a result tuple, or a side effect such as a list of tuples or an
+        exception) and returning ``(client, source_blob, dest_blob)``
+    """
+
+    def _make(*, exists: bool = True, rewrite: Any = (None, 1000, 1000)) -> tuple[Mock, Mock, Mock]:
+        client, bucket = _client_mock(), _bucket_mock()
+        source_blob, dest_blob = _blob_mock(), _blob_mock()
+
+        client.bucket.return_value = bucket
+        bucket.blob.side_effect = [source_blob, dest_blob]
+        source_blob.exists.return_value = exists
+
+        if isinstance(rewrite, tuple):
+            dest_blob.rewrite.return_value = rewrite
+        else:
+            dest_blob.rewrite.side_effect = rewrite
+
+        return client, source_blob, dest_blob
+
+    return _make
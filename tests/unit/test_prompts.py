@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
+
+import pytest
 
 from core.prompts import (
     MARKDOWN_ONLY_SYSTEM_PROMPT,
@@ -14,6 +17,35 @@ from core.prompts import (
 from core.schemas import DeliveryNoteV2
 
 
+@dataclass
+class _GeminiInput:
+    """Minimal stand-in for core.extraction.GeminiInput."""
+
+    markdown: str
+    include_image: bool = False
+
+
+# Substrings checked against the first-attempt DeliveryNoteV2 prompt
+_FIRST_ATTEMPT_NEEDLES = (
+    "management_id",
+    "company_name",
+    "issue_date",
+    "delivery_date",
+    "Previous Attempt",
+    "Validation Errors",
+    "## Required Schema",
+    "## Document Content (Markdown)",
+    "## Output",
+)
+
+
+@pytest.fixture(scope="module")
+def prompt_substrings() -> dict[str, bool]:
+    """Build the first-attempt prompt once and record which needles it contains."""
+    prompt = build_extraction_prompt(_GeminiInput(markdown="# Test"), DeliveryNoteV2)
+    return {needle: needle in prompt for needle in _FIRST_ATTEMPT_NEEDLES}
+
+
 class TestSystemPrompts:
     """Test system prompt constants."""
 
@@ -45,14 +77,7 @@ class TestBuildExtractionPrompt:
 
     def test_markdown_only_mode(self) -> None:
         """Test prompt generation without image for schema-specific prompt."""
-        from dataclasses import dataclass
-
-        @dataclass
-        class GeminiInput:
-            markdown: str
-            include_image: bool = False
-
-        gemini_input = GeminiInput(markdown="# Test Document\n\nContent here.")
+        gemini_input = _GeminiInput(markdown="# Test Document\n\nContent here.")
 
         prompt = build_extraction_prompt(gemini_input, DeliveryNoteV2)
 
@@ -68,14 +93,7 @@ class TestBuildExtractionPrompt:
 
     def test_multimodal_mode(self) -> None:
         """Test prompt generation with image for schema-specific prompt."""
-        from dataclasses import dataclass
-
-        @dataclass
-        class GeminiInput:
-            markdown: str
-            include_image: bool = True
-
-        gemini_input = GeminiInput(markdown="# Test Document", include_image=True)
+        gemini_input = _GeminiInput(markdown="# Test Document", include_image=True)
 
         prompt = build_extraction_prompt(gemini_input, DeliveryNoteV2)
 
@@ -85,35 +103,15 @@ class TestBuildExtractionPrompt:
         assert "金額フィールド" in prompt or "Amounts" in prompt
         assert "management_id" in prompt
 
-    def test_includes_schema_description(self) -> None:
+    def test_includes_schema_description(self, prompt_substrings: dict[str, bool]) -> None:
         """Test that prompt includes schema field descriptions."""
-        from dataclasses import dataclass
-
-        @dataclass
-        class GeminiInput:
-            markdown: str
-            include_image: bool = False
-
-        gemini_input = GeminiInput(markdown="# Test")
-
-        prompt = build_extraction_prompt(gemini_input, DeliveryNoteV2)
-
         # Should include schema fields
-        assert "management_id" in prompt
-        assert "company_name" in prompt
-        assert "issue_date" in prompt
-        assert "delivery_date" in prompt
+        needles = ("management_id", "company_name", "issue_date", "delivery_date")
+        assert not {n for n in needles if not prompt_substrings[n]}
 
     def test_retry_context_included(self) -> None:
         """Test prompt includes previous attempts and errors on retry."""
-        from dataclasses import dataclass
-
-        @dataclass
-        class GeminiInput:
-            markdown: str
-            include_image: bool = False
-
-        gemini_input = GeminiInput(markdown="# Test")
+        gemini_input = _GeminiInput(markdown="# Test")
 
         previous_attempts = [
             {"management_id": "", "company_name": "Test Corp", "issue_date": "2025-01-13"}
@@ -132,22 +130,11 @@ class TestBuildExtractionPrompt:
         assert "management_id: Required field is empty" in prompt
         assert "Test Corp" in prompt
 
-    def test_no_retry_context_on_first_attempt(self) -> None:
+    def test_no_retry_context_on_first_attempt(self, prompt_substrings: dict[str, bool]) -> None:
         """Test prompt does not include retry context on first attempt."""
-        from dataclasses import dataclass
-
-        @dataclass
-        class GeminiInput:
-            markdown: str
-            include_image: bool = False
-
-        gemini_input = GeminiInput(markdown="# Test")
-
-        prompt = build_extraction_prompt(gemini_input, DeliveryNoteV2)
-
         # Should NOT include previous attempt section
-        assert "Previous Attempt" not in prompt
-        assert "Validation Errors" not in prompt
+        needles = ("Previous Attempt", "Validation Errors")
+        assert not {n for n in needles if prompt_substrings[n]}
 
 
 class TestBuildCorrectionPrompt:
@@ -289,34 +276,16 @@ class TestBuildInitialPrompt:
 class TestPromptStructure:
     """Test overall prompt structure and format."""
 
-    def test_schema_description_valid_markdown(self) -> None:
+    def test_schema_description_valid_markdown(self, prompt_substrings: dict[str, bool]) -> None:
         """Test schema description is valid markdown."""
-        from dataclasses import dataclass
-
-        @dataclass
-        class GeminiInput:
-            markdown: str
-            include_image: bool = False
-
-        gemini_input = GeminiInput(markdown="# Test")
-        prompt = build_extraction_prompt(gemini_input, DeliveryNoteV2)
-
         # Should have proper markdown headers
-        assert "## Required Schema" in prompt
-        assert "## Document Content (Markdown)" in prompt
-        assert "## Output" in prompt
+        needles = ("## Required Schema", "## Document Content (Markdown)", "## Output")
+        assert not {n for n in needles if not prompt_substrings[n]}
 
     def test_markdown_content_properly_formatted(self) -> None:
         """Test markdown content is wrapped in code fence."""
-        from dataclasses import dataclass
-
-        @dataclass
-        class GeminiInput:
-            markdown: str
-            include_image: bool = False
-
         test_markdown = "# Test\n\n| Col1 | Col2 |\n|------|------|\n| A | B |"
-        gemini_input = GeminiInput(markdown=test_markdown)
+        gemini_input = _GeminiInput(markdown=test_markdown)
         prompt = build_extraction_prompt(gemini_input, DeliveryNoteV2)
 
         # Should wrap markdown in code fence
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
 from datetime import date
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from unittest.mock import patch
+
+import pytest
 
 from core.linters.quality import (
     QualityLinter,
@@ -48,7 +51,7 @@ class TestYAMLLoading:
             assert hasattr(rule, "severity")
             assert hasattr(rule, "params")
 
-    def test_load_custom_config(self) -> None:
+    def test_load_custom_config(self, tmp_path: Path) -> None:
         """Test loading custom YAML configuration."""
         yaml_content = """
 version: "1.0"
@@ -64,18 +67,14 @@ rules:
       min: 0
       max: 100
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
 
-        try:
-            linter = QualityLinter(temp_path)
+        linter = QualityLinter(str(yaml_file))
 
-            assert len(linter.rules) == 1
-            assert linter.rules[0].id == "TEST1"
-            assert linter.rules[0].condition == "range_check"
-        finally:
-            Path(temp_path).unlink()
+        assert len(linter.rules) == 1
+        assert linter.rules[0].id == "TEST1"
+        assert linter.rules[0].condition == "range_check"
 
 
 # ============================================================
@@ -86,7 +85,7 @@ rules:
 class TestDateSequenceValidation:
     """Test date_sequence condition."""
 
-    def test_valid_date_sequence(self) -> None:
+    def test_valid_date_sequence(self, tmp_path: Path) -> None:
         """Test that valid date sequence passes."""
         yaml_content = """
 version: "1.0"
@@ -100,25 +99,21 @@ rules:
     params:
       fields: ["issue_date", "delivery_date", "payment_due_date"]
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            linter = QualityLinter(temp_path)
-            data = {
-                "issue_date": date(2025, 1, 1),
-                "delivery_date": date(2025, 1, 10),
-                "payment_due_date": date(2025, 1, 31),
-            }
-            result = linter.validate(data)
-
-            assert result.passed is True
-            assert len(result.warnings) == 0
-        finally:
-            Path(temp_path).unlink()
-
-    def test_invalid_date_sequence(self) -> None:
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
+
+        linter = QualityLinter(str(yaml_file))
+        data = {
+            "issue_date": date(2025, 1, 1),
+            "delivery_date": date(2025, 1, 10),
+            "payment_due_date": date(2025, 1, 31),
+        }
+        result = linter.validate(data)
+
+        assert result.passed is True
+        assert len(result.warnings) == 0
+
+    def test_invalid_date_sequence(self, tmp_path: Path) -> None:
         """Test that invalid date sequence produces warning."""
         yaml_content = """
 version: "1.0"
@@ -132,25 +127,21 @@ rules:
     params:
       fields: ["issue_date", "delivery_date"]
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            linter = QualityLinter(temp_path)
-            data = {
-                "issue_date": date(2025, 1, 15),  # After delivery_date
-                "delivery_date": date(2025, 1, 10),
-            }
-            result = linter.validate(data)
-
-            assert result.passed is False
-            assert len(result.warnings) == 1
-            assert "should not be after" in result.warnings[0].message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_date_sequence_with_missing_dates(self) -> None:
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
+
+        linter = QualityLinter(str(yaml_file))
+        data = {
+            "issue_date": date(2025, 1, 15),  # After delivery_date
+            "delivery_date": date(2025, 1, 10),
+        }
+        result = linter.validate(data)
+
+        assert result.passed is False
+        assert len(result.warnings) == 1
+        assert "should not be after" in result.warnings[0].message
+
+    def test_date_sequence_with_missing_dates(self, tmp_path: Path) -> None:
         """Test date sequence when some dates are missing."""
         yaml_content = """
 version: "1.0"
@@ -164,23 +155,19 @@ rules:
     params:
       fields: ["issue_date", "delivery_date", "payment_due_date"]
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            linter = QualityLinter(temp_path)
-            data = {
-                "issue_date": date(2025, 1, 1),
-                # delivery_date missing
-                "payment_due_date": date(2025, 1, 31),
-            }
-            result = linter.validate(data)
-
-            # Should pass because missing dates are skipped
-            assert result.passed is True
-        finally:
-            Path(temp_path).unlink()
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
+
+        linter = QualityLinter(str(yaml_file))
+        data = {
+            "issue_date": date(2025, 1, 1),
+            # delivery_date missing
+            "payment_due_date": date(2025, 1, 31),
+        }
+        result = linter.validate(data)
+
+        # Should pass because missing dates are skipped
+        assert result.passed is True
 
 
 # ============================================================
@@ -191,7 +178,7 @@ rules:
 class TestRangeCheck:
     """Test range_check condition."""
 
-    def test_value_within_range(self) -> None:
+    def test_value_within_range(self, tmp_path: Path) -> None:
         """Test that value within range passes."""
         yaml_content = """
 version: "1.0"
@@ -206,21 +193,17 @@ rules:
       min: 0
       max: 100000000
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
 
-        try:
-            linter = QualityLinter(temp_path)
-            data = {"total_amount": 50000}
-            result = linter.validate(data)
+        linter = QualityLinter(str(yaml_file))
+        data = {"total_amount": 50000}
+        result = linter.validate(data)
 
-            assert result.passed is True
-            assert len(result.warnings) == 0
-        finally:
-            Path(temp_path).unlink()
+        assert result.passed is True
+        assert len(result.warnings) == 0
 
-    def test_value_exceeds_max(self) -> None:
+    def test_value_exceeds_max(self, tmp_path: Path) -> None:
         """Test that value exceeding max produces warning."""
         yaml_content = """
 version: "1.0"
@@ -235,22 +218,18 @@ rules:
       max: 100000000
       message: "Amount exceeds typical range"
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            linter = QualityLinter(temp_path)
-            data = {"total_amount": 200000000}  # Exceeds max
-            result = linter.validate(data)
-
-            assert result.passed is False
-            assert len(result.warnings) == 1
-            assert "Amount exceeds typical range" in result.warnings[0].message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_value_below_min(self) -> None:
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
+
+        linter = QualityLinter(str(yaml_file))
+        data = {"total_amount": 200000000}  # Exceeds max
+        result = linter.validate(data)
+
+        assert result.passed is False
+        assert len(result.warnings) == 1
+        assert "Amount exceeds typical range" in result.warnings[0].message
+
+    def test_value_below_min(self, tmp_path: Path) -> None:
         """Test that value below min produces warning."""
         yaml_content = """
 version: "1.0"
@@ -265,22 +244,18 @@ rules:
       min: 100
       max: 100000000
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            linter = QualityLinter(temp_path)
-            data = {"total_amount": 50}  # Below min
-            result = linter.validate(data)
-
-            assert result.passed is False
-            assert len(result.warnings) == 1
-            assert "below minimum" in result.warnings[0].message.lower()
-        finally:
-            Path(temp_path).unlink()
-
-    def test_missing_value_skipped(self) -> None:
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
+
+        linter = QualityLinter(str(yaml_file))
+        data = {"total_amount": 50}  # Below min
+        result = linter.validate(data)
+
+        assert result.passed is False
+        assert len(result.warnings) == 1
+        assert "below minimum" in result.warnings[0].message.lower()
+
+    def test_missing_value_skipped(self, tmp_path: Path) -> None:
         """Test that missing value is skipped."""
         yaml_content = """
 version: "1.0"
@@ -295,19 +270,15 @@ rules:
       min: 0
       max: 100000000
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
 
-        try:
-            linter = QualityLinter(temp_path)
-            data = {}  # total_amount missing
-            result = linter.validate(data)
+        linter = QualityLinter(str(yaml_file))
+        data = {}  # total_amount missing
+        result = linter.validate(data)
 
-            # Should pass because None values are skipped
-            assert result.passed is True
-        finally:
-            Path(temp_path).unlink()
+        # Should pass because None values are skipped
+        assert result.passed is True
 
 
 # ============================================================
@@ -318,7 +289,7 @@ rules:
 class TestVendorExistenceCheck:
     """Test vendor_exists condition."""
 
-    def test_vendor_exists_placeholder(self) -> None:
+    def test_vendor_exists_placeholder(self, tmp_path: Path) -> None:
         """Test vendor existence check (placeholder always returns True)."""
         yaml_content = """
 version: "1.0"
@@ -332,53 +303,30 @@ rules:
     params:
       master_table: "vendors"
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
 
-        try:
-            linter = QualityLinter(temp_path)
-            data = {"company_name": "テスト株式会社"}
-            result = linter.validate(data)
+        linter = QualityLinter(str(yaml_file))
+        data = {"company_name": "テスト株式会社"}
+        result = linter.validate(data)
 
-            # Placeholder implementation always returns True
-            assert result.passed is True
-        finally:
-            Path(temp_path).unlink()
+        # Placeholder implementation always returns True
+        assert result.passed is True
 
     def test_vendor_check_caching(self) -> None:
         """Test that vendor checks are cached."""
-        yaml_content = """
-version: "1.0"
-rules:
-  - id: Q3
-    name: "Vendor Master"
-    description: "Test"
-    field: "company_name"
-    condition: "vendor_exists"
-    severity: "warning"
-    params: {}
-"""
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            linter = QualityLinter(temp_path)
+        linter = QualityLinter.__new__(QualityLinter)
+        linter._vendor_cache = {}
 
-            # First call
-            data1 = {"company_name": "TestCompany"}
-            linter.validate(data1)
+        with patch.object(linter, "_query_vendor_master", return_value=True) as mock_query:
+            # First call queries the vendor master
+            assert linter._check_vendor("TestCompany") is True
             assert "TestCompany" in linter._vendor_cache
 
             # Second call with same company (should use cache)
-            data2 = {"company_name": "TestCompany"}
-            linter.validate(data2)
+            assert linter._check_vendor("TestCompany") is True
 
-            # Cache should still contain entry
-            assert "TestCompany" in linter._vendor_cache
-        finally:
-            Path(temp_path).unlink()
+        mock_query.assert_called_once_with("TestCompany")
 
 
 # ============================================================
@@ -389,7 +337,7 @@ rules:
 class TestMultipleRules:
     """Test validation with multiple rules."""
 
-    def test_multiple_warnings(self) -> None:
+    def test_multiple_warnings(self, tmp_path: Path) -> None:
         """Test that multiple warnings are collected."""
         yaml_content = """
 version: "1.0"
@@ -411,25 +359,21 @@ rules:
     params:
       max: 1000
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            linter = QualityLinter(temp_path)
-            data = {
-                "issue_date": date(2025, 1, 15),
-                "delivery_date": date(2025, 1, 10),  # Before issue_date
-                "total_amount": 5000,  # Exceeds max
-            }
-            result = linter.validate(data)
-
-            assert result.passed is False
-            assert len(result.warnings) == 2
-        finally:
-            Path(temp_path).unlink()
-
-    def test_no_warnings(self) -> None:
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
+
+        linter = QualityLinter(str(yaml_file))
+        data = {
+            "issue_date": date(2025, 1, 15),
+            "delivery_date": date(2025, 1, 10),  # Before issue_date
+            "total_amount": 5000,  # Exceeds max
+        }
+        result = linter.validate(data)
+
+        assert result.passed is False
+        assert len(result.warnings) == 2
+
+    def test_no_warnings(self, tmp_path: Path) -> None:
         """Test that clean data produces no warnings."""
         yaml_content = """
 version: "1.0"
@@ -444,19 +388,15 @@ rules:
       min: 0
       max: 100000
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
 
-        try:
-            linter = QualityLinter(temp_path)
-            data = {"total_amount": 5000}
-            result = linter.validate(data)
+        linter = QualityLinter(str(yaml_file))
+        data = {"total_amount": 5000}
+        result = linter.validate(data)
 
-            assert result.passed is True
-            assert len(result.warnings) == 0
-        finally:
-            Path(temp_path).unlink()
+        assert result.passed is True
+        assert len(result.warnings) == 0
 
 
 # ============================================================
@@ -526,6 +466,22 @@ class TestQualityRule:
         assert rule.condition == "range_check"
         assert rule.params["min"] == 0
 
+    def test_rule_is_immutable(self) -> None:
+        """Test rule fields cannot be reassigned and carry no instance dict."""
+        rule = QualityRule(
+            id="Q1",
+            name="Test Rule",
+            description="Test description",
+            field="test_field",
+            condition="range_check",
+            severity="warning",
+            params={},
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            rule.severity = "info"  # type: ignore[misc]
+        assert not hasattr(rule, "__dict__")
+
 
 # ============================================================
 # Unknown Condition Tests
@@ -535,7 +491,7 @@ class TestQualityRule:
 class TestUnknownCondition:
     """Test handling of unknown conditions."""
 
-    def test_unknown_condition_skipped(self) -> None:
+    def test_unknown_condition_skipped(self, tmp_path: Path) -> None:
         """Test that unknown conditions are skipped gracefully."""
         yaml_content = """
 version: "1.0"
@@ -548,17 +504,13 @@ rules:
     severity: "warning"
     params: {}
 """
-        with NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            temp_path = f.name
-
-        try:
-            linter = QualityLinter(temp_path)
-            data = {"test_field": "value"}
-            result = linter.validate(data)
-
-            # Unknown condition is skipped, so no warnings
-            assert result.passed is True
-            assert len(result.warnings) == 0
-        finally:
-            Path(temp_path).unlink()
+        yaml_file = tmp_path / "rules.yaml"
+        yaml_file.write_text(yaml_content, encoding="utf-8")
+
+        linter = QualityLinter(str(yaml_file))
+        data = {"test_field": "value"}
+        result = linter.validate(data)
+
+        # Unknown condition is skipped, so no warnings
+        assert result.passed is True
+        assert len(result.warnings) == 0
@@ -6,8 +6,12 @@ See: docs/specs/03_saga.md
 
 from __future__ import annotations
 
-from unittest.mock import Mock, patch
+import re
+from collections.abc import Iterator
+from functools import partial
+from unittest.mock import MagicMock, Mock
 
+import pytest
 from src.core.saga import (
     DocumentPersistenceSteps,
     SagaFailedError,
@@ -18,6 +22,60 @@ from src.core.saga import (
     persist_document,
 )
 
+pytestmark = pytest.mark.xdist_group(name="sagas")
+
+
+@pytest.fixture(scope="module")
+def _mock_db_tree() -> tuple[MagicMock, MagicMock]:
+    """Build the Firestore client mock once per module."""
+    db = MagicMock()
+    return db, db.collection.return_value.document.return_value
+
+
+@pytest.fixture
+def mock_db_factory(
+    _mock_db_tree: tuple[MagicMock, MagicMock],
+) -> Iterator[tuple[MagicMock, MagicMock]]:
+    """Firestore client mock shared by the module and reset after each test.
+
+    Yields:
+        Tuple of (db client, document reference returned by collection().document())
+    """
+    yield _mock_db_tree
+    _mock_db_tree[0].reset_mock()
+
+
+def _fail_after_append(log: list[str], name: str) -> None:
+    log.append(name)
+    raise Exception(f"{name} failed")
+
+
+def _make_steps(
+    n: int, fail_idx: int | None, executed: list[str], compensated: list[str]
+) -> list[SagaStep]:
+    """Build steps step1..stepN that record into executed/compensated.
+
+    The step at fail_idx records itself and then raises.
+    """
+    steps = []
+    for i in range(n):
+        name = f"step{i + 1}"
+        if i == fail_idx:
+            execute = partial(_fail_after_append, executed, name)
+        else:
+            execute = partial(executed.append, name)
+        steps.append(
+            SagaStep(name=name, execute=execute, compensate=partial(compensated.append, name))
+        )
+    return steps
+
+
+def _missing_substrings(text: str, *needles: str) -> set[str]:
+    """Return the needles absent from text, found with a single regex scan."""
+    # Longest first so a needle is never shadowed by one of its prefixes
+    alternation = "|".join(map(re.escape, sorted(needles, key=len, reverse=True)))
+    return set(needles) - set(re.findall(alternation, text))
+
 
 class TestSagaStep:
     """Tests for SagaStep dataclass."""
@@ -73,167 +131,59 @@ class TestSagaResult:
 class TestSagaOrchestrator:
     """Tests for SagaOrchestrator class."""
 
-    def test_all_steps_succeed(self) -> None:
-        """Happy path: all steps execute successfully."""
-        executed = []
-        compensated = []
-
-        steps = [
-            SagaStep(
-                name="step1",
-                execute=lambda: executed.append("step1"),
-                compensate=lambda: compensated.append("step1"),
-            ),
-            SagaStep(
-                name="step2",
-                execute=lambda: executed.append("step2"),
-                compensate=lambda: compensated.append("step2"),
-            ),
-            SagaStep(
-                name="step3",
-                execute=lambda: executed.append("step3"),
-                compensate=lambda: compensated.append("step3"),
-            ),
-        ]
-
-        saga = SagaOrchestrator()
-        result = saga.execute(steps)
-
-        assert result.success is True
-        assert executed == ["step1", "step2", "step3"]
-        assert compensated == []
-        assert result.executed_steps == ["step1", "step2", "step3"]
-
-    def test_first_step_fails_no_compensation(self) -> None:
-        """When first step fails, no compensation needed."""
-        executed = []
-        compensated = []
-
-        def fail_step1() -> None:
-            executed.append("step1")
-            raise Exception("Step 1 failed")
-
-        steps = [
-            SagaStep(
-                name="step1",
-                execute=fail_step1,
-                compensate=lambda: compensated.append("step1"),
-            ),
-            SagaStep(
-                name="step2",
-                execute=lambda: executed.append("step2"),
-                compensate=lambda: compensated.append("step2"),
-            ),
-        ]
-
-        saga = SagaOrchestrator()
-        result = saga.execute(steps)
-
-        assert result.success is False
-        assert result.failed_step == "step1"
-        assert executed == ["step1"]
-        # No compensation because step1 wasn't added to executed_steps before failing
-        assert compensated == []
-
-    def test_second_step_fails_compensates_first(self) -> None:
-        """When step 2 fails, step 1 is compensated."""
-        executed = []
-        compensated = []
-
-        def fail_step2() -> None:
-            executed.append("step2")
-            raise Exception("Step 2 failed")
-
-        steps = [
-            SagaStep(
-                name="step1",
-                execute=lambda: executed.append("step1"),
-                compensate=lambda: compensated.append("step1"),
-            ),
-            SagaStep(
-                name="step2",
-                execute=fail_step2,
-                compensate=lambda: compensated.append("step2"),
-            ),
-        ]
-
-        saga = SagaOrchestrator()
-        result = saga.execute(steps)
-
-        assert result.success is False
-        assert result.failed_step == "step2"
-        assert executed == ["step1", "step2"]
-        assert compensated == ["step1"]  # Only step1 compensated
-        assert result.compensated_steps == ["step1"]
-
-    def test_third_step_fails_compensates_in_reverse_order(self) -> None:
-        """When step 3 fails, steps 2 and 1 are compensated in reverse order."""
-        executed = []
-        compensated = []
-
-        def fail_step3() -> None:
-            executed.append("step3")
-            raise Exception("Step 3 failed")
-
-        steps = [
-            SagaStep(
-                name="step1",
-                execute=lambda: executed.append("step1"),
-                compensate=lambda: compensated.append("step1"),
-            ),
-            SagaStep(
-                name="step2",
-                execute=lambda: executed.append("step2"),
-                compensate=lambda: compensated.append("step2"),
-            ),
-            SagaStep(
-                name="step3",
-                execute=fail_step3,
-                compensate=lambda: compensated.append("step3"),
-            ),
-        ]
-
-        saga = SagaOrchestrator()
-        result = saga.execute(steps)
-
-        assert result.success is False
-        assert result.failed_step == "step3"
-        assert executed == ["step1", "step2", "step3"]
-        # Compensated in reverse order
-        assert compensated == ["step2", "step1"]
-
-    def test_compensation_failure_logged_but_continues(self) -> None:
+    @pytest.fixture(scope="class")
+    def orchestrator(self) -> SagaOrchestrator:
+        """Orchestrator shared by the class; execute() resets its per-run state."""
+        return SagaOrchestrator()
+
+    @pytest.mark.parametrize(
+        ("fail_idx", "expected_compensated"),
+        [
+            (None, []),
+            (0, []),  # step1 never reached executed_steps, nothing to undo
+            (1, ["step1"]),
+            (2, ["step2", "step1"]),  # compensated in reverse order
+        ],
+        ids=["all_succeed", "first_fails", "second_fails", "third_fails"],
+    )
+    def test_compensates_executed_steps_in_reverse(
+        self,
+        orchestrator: SagaOrchestrator,
+        fail_idx: int | None,
+        expected_compensated: list[str],
+    ) -> None:
+        """Failing step N compensates steps N-1..1; success compensates nothing."""
+        executed: list[str] = []
+        compensated: list[str] = []
+        steps = _make_steps(3, fail_idx, executed, compensated)
+
+        result = orchestrator.execute(steps)
+
+        expected_executed = ["step1", "step2", "step3"][: 3 if fail_idx is None else fail_idx + 1]
+        assert result.success is (fail_idx is None)
+        assert executed == expected_executed
+        assert compensated == expected_compensated
+        assert result.compensated_steps == expected_compensated
+        if fail_idx is None:
+            assert result.failed_step is None
+            assert result.executed_steps == expected_executed
+        else:
+            assert result.failed_step == f"step{fail_idx + 1}"
+
+    def test_compensation_failure_logged_but_continues(
+        self, orchestrator: SagaOrchestrator
+    ) -> None:
         """If compensation fails, continue compensating other steps."""
-        executed = []
-        compensated = []
+        executed: list[str] = []
+        compensated: list[str] = []
 
         def fail_step2_compensation() -> None:
             raise Exception("Compensation failed")
 
-        def fail_step3() -> None:
-            executed.append("step3")
-            raise Exception("Step 3 failed")
-
-        steps = [
-            SagaStep(
-                name="step1",
-                execute=lambda: executed.append("step1"),
-                compensate=lambda: compensated.append("step1"),
-            ),
-            SagaStep(
-                name="step2",
-                execute=lambda: executed.append("step2"),
-                compensate=fail_step2_compensation,
-            ),
-            SagaStep(
-                name="step3",
-                execute=fail_step3,
-                compensate=lambda: compensated.append("step3"),
-            ),
-        ]
+        steps = _make_steps(3, 2, executed, compensated)
+        steps[1].compensate = fail_step2_compensation
 
-        saga = SagaOrchestrator()
-        result = saga.execute(steps)
+        result = orchestrator.execute(steps)
 
         assert result.success is False
         # step1 should still be compensated even though step2 compensation failed
@@ -242,10 +192,9 @@ class TestSagaOrchestrator:
         assert len(result.compensation_failures) == 1
         assert result.compensation_failures[0][0] == "step2"
 
-    def test_empty_steps_list(self) -> None:
+    def test_empty_steps_list(self, orchestrator: SagaOrchestrator) -> None:
         """Empty steps list should succeed immediately."""
-        saga = SagaOrchestrator()
-        result = saga.execute([])
+        result = orchestrator.execute([])
 
         assert result.success is True
         assert result.executed_steps == []
@@ -263,11 +212,14 @@ class TestGenerateFailedReport:
             errors=["Invalid management_id format"],
         )
 
-        assert "test-hash-123" in report
-        assert "gs://bucket/input/test.pdf" in report
-        assert "Invalid management_id format" in report
-        assert "flash" in report
-        assert "Processing Failed Report" in report
+        assert not _missing_substrings(
+            report,
+            "test-hash-123",
+            "gs://bucket/input/test.pdf",
+            "Invalid management_id format",
+            "flash",
+            "Processing Failed Report",
+        )
 
     def test_report_with_saga_error(self) -> None:
         """Test report generation with saga error."""
@@ -281,9 +233,7 @@ class TestGenerateFailedReport:
             saga_error=saga_error,
         )
 
-        assert "Saga Error" in report
-        assert "gcs_copy" in report
-        assert "GCS unavailable" in report
+        assert not _missing_substrings(report, "Saga Error", "gcs_copy", "GCS unavailable")
 
     def test_report_with_multiple_attempts(self) -> None:
         """Test report with multiple extraction attempts."""
@@ -300,19 +250,17 @@ class TestGenerateFailedReport:
             errors=["Error 1", "Error 2"],
         )
 
-        assert "Attempt 1" in report
-        assert "Attempt 2" in report
-        assert "Attempt 3" in report
-        assert "Error 1" in report
-        assert "Error 2" in report
+        assert not _missing_substrings(
+            report, "Attempt 1", "Attempt 2", "Attempt 3", "Error 1", "Error 2"
+        )
 
 
 class TestDocumentPersistenceSteps:
     """Tests for DocumentPersistenceSteps factory."""
 
-    def test_create_all_steps(self) -> None:
+    def test_create_all_steps(self, mock_db_factory: tuple[MagicMock, MagicMock]) -> None:
         """Test creating all persistence steps."""
-        mock_db = Mock()
+        mock_db, _ = mock_db_factory
         mock_storage = Mock()
 
         factory = DocumentPersistenceSteps(
@@ -333,11 +281,9 @@ class TestDocumentPersistenceSteps:
         assert steps[2].name == "gcs_delete_source"
         assert steps[3].name == "db_complete"
 
-    def test_db_pending_step(self) -> None:
+    def test_db_pending_step(self, mock_db_factory: tuple[MagicMock, MagicMock]) -> None:
         """Test db_pending step execution."""
-        mock_db = Mock()
-        mock_doc_ref = Mock()
-        mock_db.collection.return_value.document.return_value = mock_doc_ref
+        mock_db, mock_doc_ref = mock_db_factory
 
         factory = DocumentPersistenceSteps(
             db_client=mock_db,
@@ -358,11 +304,9 @@ class TestDocumentPersistenceSteps:
         assert call_args["status"] == "PENDING"
         assert call_args["validated_json"] == {"management_id": "TEST-001"}
 
-    def test_db_pending_compensation(self) -> None:
+    def test_db_pending_compensation(self, mock_db_factory: tuple[MagicMock, MagicMock]) -> None:
         """Test db_pending step compensation."""
-        mock_db = Mock()
-        mock_doc_ref = Mock()
-        mock_db.collection.return_value.document.return_value = mock_doc_ref
+        mock_db, mock_doc_ref = mock_db_factory
 
         factory = DocumentPersistenceSteps(
             db_client=mock_db,
@@ -384,10 +328,11 @@ class TestDocumentPersistenceSteps:
 class TestPersistDocument:
     """Tests for persist_document function."""
 
-    @patch("src.core.saga.DocumentPersistenceSteps")
-    def test_persist_document_success(self, mock_steps_class: Mock) -> None:
+    def test_persist_document_success(
+        self, monkeypatch: pytest.MonkeyPatch, mock_db_factory: tuple[MagicMock, MagicMock]
+    ) -> None:
         """Test successful document persistence."""
-        mock_db = Mock()
+        mock_db, _ = mock_db_factory
         mock_storage = Mock()
 
         # Setup mock steps that succeed
@@ -396,7 +341,7 @@ class TestPersistDocument:
         ]
         mock_factory = Mock()
         mock_factory.create_all_steps.return_value = mock_steps
-        mock_steps_class.return_value = mock_factory
+        monkeypatch.setattr("src.core.saga.DocumentPersistenceSteps", lambda **_: mock_factory)
 
         result = persist_document(
             db_client=mock_db,
@@ -410,10 +355,11 @@ class TestPersistDocument:
 
         assert result.success is True
 
-    @patch("src.core.saga.DocumentPersistenceSteps")
-    def test_persist_document_failure(self, mock_steps_class: Mock) -> None:
+    def test_persist_document_failure(
+        self, monkeypatch: pytest.MonkeyPatch, mock_db_factory: tuple[MagicMock, MagicMock]
+    ) -> None:
         """Test document persistence failure."""
-        mock_db = Mock()
+        mock_db, _ = mock_db_factory
         mock_storage = Mock()
 
         def fail_step() -> None:
@@ -425,7 +371,7 @@ class TestPersistDocument:
         ]
         mock_factory = Mock()
         mock_factory.create_all_steps.return_value = mock_steps
-        mock_steps_class.return_value = mock_factory
+        monkeypatch.setattr("src.core.saga.DocumentPersistenceSteps", lambda **_: mock_factory)
 
         result = persist_document(
             db_client=mock_db,
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import date
+from types import MappingProxyType
 
 import pytest
 from pydantic import ValidationError
@@ -24,6 +25,24 @@ from core.schemas import (
     validate_new_document,
 )
 
+pytestmark = pytest.mark.xdist_group(name="schemas")
+
+_ISSUE_DATE = date(2025, 1, 13)
+_DELIVERY_DATE = date(2025, 1, 15)
+_PAYMENT_DUE_DATE = date(2025, 2, 13)
+_COMPANY_NAME = "テスト株式会社"
+
+# Read-only base for DeliveryNote payloads; tests build variants with {**_BASE_V1, ...}
+_BASE_V1 = MappingProxyType(
+    {"management_id": "ABC123", "company_name": _COMPANY_NAME, "issue_date": _ISSUE_DATE}
+)
+
+
+def _error_locs(error: ValidationError) -> set[tuple[int | str, ...]]:
+    """Return the field locations of a ValidationError without rendering its message."""
+    return {e["loc"] for e in error.errors(include_url=False, include_context=False)}
+
+
 # ============================================================
 # Schema Validation Tests
 # ============================================================
@@ -34,42 +53,29 @@ class TestDeliveryNoteV1:
 
     def test_valid_delivery_note_v1(self) -> None:
         """Test creating valid DeliveryNoteV1 instance."""
-        data = {
-            "management_id": "ABC123",
-            "company_name": "テスト株式会社",
-            "issue_date": date(2025, 1, 13),
-        }
-        doc = DeliveryNoteV1(**data)
+        doc = DeliveryNoteV1(**_BASE_V1)
 
         assert doc.schema_version == "v1"
         assert doc.document_type == "delivery_note"
         assert doc.management_id == "ABC123"
-        assert doc.company_name == "テスト株式会社"
-        assert doc.issue_date == date(2025, 1, 13)
+        assert doc.company_name == _COMPANY_NAME
+        assert doc.issue_date == _ISSUE_DATE
 
     def test_missing_required_field(self) -> None:
         """Test validation error when required field missing."""
-        data = {
-            "management_id": "ABC123",
-            # missing company_name
-            "issue_date": date(2025, 1, 13),
-        }
+        data = {"management_id": "ABC123", "issue_date": _ISSUE_DATE}  # missing company_name
         with pytest.raises(ValidationError) as exc_info:
             DeliveryNoteV1(**data)
 
-        assert "company_name" in str(exc_info.value)
+        assert _error_locs(exc_info.value) == {("company_name",)}
 
     def test_invalid_date_type(self) -> None:
         """Test validation error for invalid date type."""
-        data = {
-            "management_id": "ABC123",
-            "company_name": "テスト株式会社",
-            "issue_date": "not-a-date",
-        }
+        data = {**_BASE_V1, "issue_date": "not-a-date"}
         with pytest.raises(ValidationError) as exc_info:
             DeliveryNoteV1(**data)
 
-        assert "issue_date" in str(exc_info.value)
+        assert _error_locs(exc_info.value) == {("issue_date",)}
 
 
 class TestDeliveryNoteV2:
@@ -78,11 +84,9 @@ class TestDeliveryNoteV2:
     def test_valid_delivery_note_v2(self) -> None:
         """Test creating valid DeliveryNoteV2 instance."""
         data = {
-            "management_id": "ABC123",
-            "company_name": "テスト株式会社",
-            "issue_date": date(2025, 1, 13),
-            "delivery_date": date(2025, 1, 15),
-            "payment_due_date": date(2025, 2, 13),
+            **_BASE_V1,
+            "delivery_date": _DELIVERY_DATE,
+            "payment_due_date": _PAYMENT_DUE_DATE,
             "total_amount": 10000,
         }
         doc = DeliveryNoteV2(**data)
@@ -90,16 +94,14 @@ class TestDeliveryNoteV2:
         assert doc.schema_version == "v2"
         assert doc.document_type == "delivery_note"
         assert doc.total_amount == 10000
-        assert doc.delivery_date == date(2025, 1, 15)
-        assert doc.payment_due_date == date(2025, 2, 13)
+        assert doc.delivery_date == _DELIVERY_DATE
+        assert doc.payment_due_date == _PAYMENT_DUE_DATE
 
     def test_optional_payment_due_date(self) -> None:
         """Test that payment_due_date is optional."""
         data = {
-            "management_id": "ABC123",
-            "company_name": "テスト株式会社",
-            "issue_date": date(2025, 1, 13),
-            "delivery_date": date(2025, 1, 15),
+            **_BASE_V1,
+            "delivery_date": _DELIVERY_DATE,
             "payment_due_date": None,
             "total_amount": 10000,
         }
@@ -109,17 +111,11 @@ class TestDeliveryNoteV2:
 
     def test_negative_amount_rejected(self) -> None:
         """Test validation error for negative total_amount."""
-        data = {
-            "management_id": "ABC123",
-            "company_name": "テスト株式会社",
-            "issue_date": date(2025, 1, 13),
-            "delivery_date": date(2025, 1, 15),
-            "total_amount": -100,
-        }
+        data = {**_BASE_V1, "delivery_date": _DELIVERY_DATE, "total_amount": -100}
         with pytest.raises(ValidationError) as exc_info:
             DeliveryNoteV2(**data)
 
-        assert "total_amount" in str(exc_info.value)
+        assert _error_locs(exc_info.value) == {("total_amount",)}
 
 
 class TestInvoiceV1:
@@ -129,8 +125,8 @@ class TestInvoiceV1:
         """Test creating valid InvoiceV1 instance."""
         data = {
             "invoice_number": "INV-2025-001",
-            "company_name": "テスト株式会社",
-            "issue_date": date(2025, 1, 13),
+            "company_name": _COMPANY_NAME,
+            "issue_date": _ISSUE_DATE,
             "total_amount": 11000,
             "tax_amount": 1000,
         }
@@ -146,15 +142,15 @@ class TestInvoiceV1:
         """Test validation error for negative tax_amount."""
         data = {
             "invoice_number": "INV-2025-001",
-            "company_name": "テスト株式会社",
-            "issue_date": date(2025, 1, 13),
+            "company_name": _COMPANY_NAME,
+            "issue_date": _ISSUE_DATE,
             "total_amount": 11000,
             "tax_amount": -100,
         }
         with pytest.raises(ValidationError) as exc_info:
             InvoiceV1(**data)
 
-        assert "tax_amount" in str(exc_info.value)
+        assert _error_locs(exc_info.value) == {("tax_amount",)}
 
 
 # ============================================================
@@ -236,7 +232,7 @@ class TestDeliveryNoteV1ToV2Migration:
         v1_data = {
             "schema_version": "v1",
             "management_id": "ABC123",
-            "company_name": "テスト株式会社",
+            "company_name": _COMPANY_NAME,
             "issue_date": "2025-01-13",
             "delivery_date": "2025-01-15",
             "payment_due_date": None,  # Explicitly provided as None
@@ -255,7 +251,7 @@ class TestDeliveryNoteV1ToV2Migration:
         v1_data = {
             "schema_version": "v1",
             "management_id": "ABC123",
-            "company_name": "テスト株式会社",
+            "company_name": _COMPANY_NAME,
             "issue_date": "2025-01-13",
         }
         v2_data = migrate_delivery_note_v1_to_v2(v1_data)
@@ -278,7 +274,7 @@ class TestDeliveryNoteV1ToV2Migration:
         v1_data = {
             "schema_version": "v1",
             "management_id": "ABC123",
-            "company_name": "テスト株式会社",
+            "company_name": _COMPANY_NAME,
             "issue_date": "2025-01-13",
             "total_amount": 5000,
         }
@@ -297,7 +293,7 @@ class TestMigrateData:
         v2_data = {
             "schema_version": "v2",
             "management_id": "ABC123",
-            "company_name": "テスト株式会社",
+            "company_name": _COMPANY_NAME,
             "issue_date": "2025-01-13",
             "delivery_date": "2025-01-15",
             "total_amount": 10000,
@@ -311,7 +307,7 @@ class TestMigrateData:
         v1_data = {
             "schema_version": "v1",
             "management_id": "ABC123",
-            "company_name": "テスト株式会社",
+            "company_name": _COMPANY_NAME,
             "issue_date": "2025-01-13",
         }
         result = migrate_data("delivery_note", v1_data)
@@ -323,7 +319,7 @@ class TestMigrateData:
         """Test that missing schema_version defaults to v1."""
         data = {
             "management_id": "ABC123",
-            "company_name": "テスト株式会社",
+            "company_name": _COMPANY_NAME,
             "issue_date": "2025-01-13",
         }
         result = migrate_data("delivery_note", data)
@@ -398,6 +394,14 @@ class TestGenerateSchemaDescription:
 
         assert "migration_metadata" not in description
 
+    def test_description_cached_per_schema(self) -> None:
+        """Test that each schema class is rendered only once."""
+        first = generate_schema_description(DeliveryNoteV2)
+        second = generate_schema_description(DeliveryNoteV2)
+
+        assert first is second
+        assert generate_schema_description(InvoiceV1) is not first
+
 
 # ============================================================
 # Schema Registry Tests
@@ -6,44 +6,64 @@ See: docs/specs/03_saga.md
 
 from __future__ import annotations
 
-import sys
+import pickle
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, Mock, patch
+from operator import attrgetter
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock, call, patch
 
 import pytest
-
-# Mock Google Cloud modules before importing storage
-sys.modules["google.cloud"] = Mock()
-sys.modules["google.cloud.storage"] = Mock()
-sys.modules["google.api_core"] = Mock()
-sys.modules["google.api_core.retry"] = Mock()
-sys.modules["google.api_core.exceptions"] = Mock()
-
-# Create mock exceptions
-NotFound = type("NotFound", (Exception,), {})
-GoogleAPIError = type("GoogleAPIError", (Exception,), {})
-sys.modules["google.api_core.exceptions"].NotFound = NotFound
-sys.modules["google.api_core.exceptions"].GoogleAPIError = GoogleAPIError
-
-from src.core.storage import (  # noqa: E402
+from src.core.storage import (
     DEFAULT_RETRY,
+    GoogleAPIError,
     InvalidGCSPathError,
+    NotFound,
     StorageClient,
     StorageError,
     _sanitize_filename,
     copy_blob,
+    copy_blobs_batch,
     delete_blob,
+    delete_blobs_batch,
     download_as_bytes,
     file_exists,
     generate_destination_path,
     list_blobs,
+    list_blobs_iter,
     parse_gcs_path,
     upload_string,
 )
-from src.core.storage import (  # noqa: E402
+from src.core.storage import (
     FileNotFoundError as GCSFileNotFoundError,
 )
 
+# Fixed timestamp for tests whose assertions do not depend on it
+_SENTINEL_TS = datetime(2025, 1, 1, tzinfo=UTC)
+
+# Shared timestamps and issue dates, built once at import
+_TS_20250115 = datetime(2025, 1, 15, 10, 30, 0, tzinfo=UTC)
+_TS_20250320 = datetime(2025, 3, 20, tzinfo=UTC)
+_DT_ISSUE_20250320 = datetime(2025, 3, 20)
+
+# Read-only schema data shared by destination path tests; variants copy it
+_SCHEMA_BASE = MappingProxyType(
+    {
+        "management_id": "INV-2025-001",
+        "company_name": "山田商事",
+        "issue_date": "2025-01-15",
+    }
+)
+
+# Characters that must never survive _sanitize_filename
+_INVALID_CHARS = frozenset('<>:"/\\|?*\x7f' + "".join(map(chr, range(0x20))))
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    # blob_chain fixture: (client, source_blob, dest_blob)
+    BlobChainFactory = Callable[..., tuple[Mock, Mock, Mock]]
+
 
 class TestParseGCSPath:
     """Tests for parse_gcs_path function."""
@@ -62,40 +82,31 @@ class TestParseGCSPath:
         assert bucket == "bucket"
         assert blob == "file.pdf"
 
-    def test_empty_path_raises(self) -> None:
-        """Test that empty path raises InvalidGCSPathError."""
-        with pytest.raises(InvalidGCSPathError) as exc_info:
-            parse_gcs_path("")
-
-        assert "empty path" in str(exc_info.value)
-
-    def test_missing_gs_prefix_raises(self) -> None:
-        """Test that path without gs:// prefix raises error."""
-        with pytest.raises(InvalidGCSPathError) as exc_info:
-            parse_gcs_path("bucket/path/file.pdf")
-
-        assert "must start with gs://" in str(exc_info.value)
-
-    def test_missing_blob_path_raises(self) -> None:
-        """Test that path without blob raises error."""
-        with pytest.raises(InvalidGCSPathError) as exc_info:
-            parse_gcs_path("gs://bucket")
-
-        assert "missing blob path" in str(exc_info.value)
-
-    def test_empty_bucket_raises(self) -> None:
-        """Test that empty bucket name raises error."""
-        with pytest.raises(InvalidGCSPathError) as exc_info:
-            parse_gcs_path("gs:///path/to/file.pdf")
-
-        assert "empty bucket" in str(exc_info.value)
-
-    def test_empty_blob_path_raises(self) -> None:
-        """Test that empty blob path raises error."""
-        with pytest.raises(InvalidGCSPathError) as exc_info:
-            parse_gcs_path("gs://bucket/")
-
-        assert "empty blob path" in str(exc_info.value)
+    def test_repeated_paths_are_cached(self) -> None:
+        """Test repeated paths reuse the cached result and failures are not cached."""
+        first = parse_gcs_path("gs://bucket/cached.pdf")
+        cached_entries = parse_gcs_path.cache_info().currsize
+
+        assert parse_gcs_path("gs://bucket/cached.pdf") is first
+        with pytest.raises(InvalidGCSPathError):
+            parse_gcs_path("bucket/cached.pdf")
+        assert parse_gcs_path.cache_info().currsize == cached_entries
+
+    @pytest.mark.parametrize(
+        ("path", "expected_msg"),
+        [
+            ("", "empty path"),
+            ("bucket/path/file.pdf", "must start with gs://"),
+            ("gs://bucket", "missing blob path"),
+            ("gs:///path/to/file.pdf", "empty bucket"),
+            ("gs://bucket/", "empty blob path"),
+        ],
+        ids=["empty", "no-prefix", "no-blob", "empty-bucket", "empty-blob"],
+    )
+    def test_invalid_paths_raise(self, path: str, expected_msg: str) -> None:
+        """Test that malformed paths raise InvalidGCSPathError with the reason."""
+        with pytest.raises(InvalidGCSPathError, match=expected_msg):
+            parse_gcs_path(path)
 
 
 class TestGenerateDestinationPath:
@@ -103,30 +114,29 @@ class TestGenerateDestinationPath:
 
     def test_valid_path_generation(self) -> None:
         """Test generating a valid destination path for delivery_note."""
-        schema_data = {
-            "document_type": "delivery_note",
-            "management_id": "INV-2025-001",
-            "company_name": "山田商事",
-            "issue_date": "2025-01-15",
-        }
-        timestamp = datetime(2025, 1, 15, 10, 30, 0, tzinfo=UTC)
-
-        result = generate_destination_path(schema_data, timestamp, "output-bucket")
+        result = generate_destination_path(
+            {**_SCHEMA_BASE, "document_type": "delivery_note"}, _TS_20250115, "output-bucket"
+        )
 
         expected = "gs://output-bucket/202501/delivery_notes/INV-2025-001_山田商事_20250115.pdf"
         assert result == expected
 
+    def test_read_only_schema_data(self) -> None:
+        """Test schema data may be passed as a read-only mapping."""
+        result = generate_destination_path(_SCHEMA_BASE, _SENTINEL_TS, "bucket")
+
+        assert result.startswith("gs://bucket/202501/unknown/")
+
     def test_path_with_datetime_issue_date(self) -> None:
         """Test path generation with datetime issue_date."""
         schema_data = {
             "document_type": "delivery_note",
             "management_id": "TEST-001",
             "company_name": "Test Co",
-            "issue_date": datetime(2025, 3, 20),
+            "issue_date": _DT_ISSUE_20250320,
         }
-        timestamp = datetime(2025, 3, 20, tzinfo=UTC)
 
-        result = generate_destination_path(schema_data, timestamp, "bucket")
+        result = generate_destination_path(schema_data, _TS_20250320, "bucket")
 
         assert "20250320" in result
         assert "/delivery_notes/" in result
@@ -139,12 +149,31 @@ class TestGenerateDestinationPath:
             "company_name": "Test Corp",
             "issue_date": "2025/04/25",
         }
-        timestamp = datetime(2025, 4, 25, tzinfo=UTC)
-
-        result = generate_destination_path(schema_data, timestamp, "bucket")
+        result = generate_destination_path(schema_data, _SENTINEL_TS, "bucket")
 
         assert "20250425" in result
 
+    @pytest.mark.parametrize(
+        "issue_date",
+        ["2025/1/5", "2025-1-5", "2025-01-5", "2025/1/05", "2025-01-05\n"],
+        ids=[
+            "single_digit_month_and_day",
+            "dashes",
+            "single_digit_day",
+            "single_digit_month",
+            "trailing_newline",
+        ],
+    )
+    def test_path_with_unpadded_issue_date(self, issue_date: str) -> None:
+        """Test issue dates without zero padding still set the filename date."""
+        result = generate_destination_path(
+            {**_SCHEMA_BASE, "document_type": "delivery_note", "issue_date": issue_date},
+            _SENTINEL_TS,
+            "bucket",
+        )
+
+        assert result.endswith("_20250105.pdf")
+
     def test_path_with_numeric_issue_date(self) -> None:
         """Test path generation with numeric issue_date."""
         schema_data = {
@@ -153,9 +182,7 @@ class TestGenerateDestinationPath:
             "company_name": "Test Inc",
             "issue_date": 20250515,  # numeric format
         }
-        timestamp = datetime(2025, 5, 15, tzinfo=UTC)
-
-        result = generate_destination_path(schema_data, timestamp, "bucket")
+        result = generate_destination_path(schema_data, _SENTINEL_TS, "bucket")
 
         assert "20250515" in result
 
@@ -163,7 +190,7 @@ class TestGenerateDestinationPath:
         """Test that missing management_id falls back to unknown folder."""
         result = generate_destination_path(
             {"company_name": "Test", "issue_date": "2025-01-01"},
-            datetime.now(UTC),
+            _SENTINEL_TS,
             "bucket",
         )
 
@@ -173,7 +200,7 @@ class TestGenerateDestinationPath:
         """Test that missing company_name falls back to unknown folder."""
         result = generate_destination_path(
             {"management_id": "ID-001", "issue_date": "2025-01-01"},
-            datetime.now(UTC),
+            _SENTINEL_TS,
             "bucket",
         )
 
@@ -181,10 +208,9 @@ class TestGenerateDestinationPath:
 
     def test_missing_issue_date_uses_timestamp(self) -> None:
         """Test that missing issue_date uses timestamp date."""
-        timestamp = datetime(2025, 1, 15, tzinfo=UTC)
         result = generate_destination_path(
             {"management_id": "ID-001", "company_name": "Test"},
-            timestamp,
+            _TS_20250115,
             "bucket",
         )
 
@@ -194,8 +220,8 @@ class TestGenerateDestinationPath:
     def test_empty_management_id_fallback_to_unknown(self) -> None:
         """Test that empty management_id falls back to unknown folder."""
         result = generate_destination_path(
-            {"management_id": "", "company_name": "Test", "issue_date": "2025-01-01"},
-            datetime.now(UTC),
+            {**_SCHEMA_BASE, "management_id": ""},
+            _SENTINEL_TS,
             "bucket",
         )
 
@@ -204,8 +230,8 @@ class TestGenerateDestinationPath:
     def test_empty_company_name_fallback_to_unknown(self) -> None:
         """Test that empty company_name falls back to unknown folder."""
         result = generate_destination_path(
-            {"management_id": "ID-001", "company_name": "", "issue_date": "2025-01-01"},
-            datetime.now(UTC),
+            {**_SCHEMA_BASE, "company_name": ""},
+            _SENTINEL_TS,
             "bucket",
         )
 
@@ -213,69 +239,53 @@ class TestGenerateDestinationPath:
 
     def test_empty_issue_date_uses_timestamp(self) -> None:
         """Test that empty issue_date uses timestamp date."""
-        timestamp = datetime(2025, 2, 20, tzinfo=UTC)
         result = generate_destination_path(
-            {"management_id": "ID-001", "company_name": "Test", "issue_date": ""},
-            timestamp,
+            {**_SCHEMA_BASE, "issue_date": ""},
+            _TS_20250320,
             "bucket",
         )
 
         # Should use timestamp date since issue_date is empty
-        assert "20250220" in result
+        assert "20250320" in result
 
 
 class TestSanitizeFilename:
     """Tests for _sanitize_filename function."""
 
-    def test_basic_sanitization(self) -> None:
-        """Test basic filename sanitization."""
-        result = _sanitize_filename("Normal Text")
-        assert result == "Normal Text"
-
-    def test_removes_invalid_characters(self) -> None:
-        """Test removal of invalid characters."""
-        result = _sanitize_filename('File<>:"/\\|?*Name')
-        assert "<" not in result
-        assert ">" not in result
-        assert ":" not in result
-
-    def test_preserves_japanese_characters(self) -> None:
-        """Test that Japanese characters are preserved."""
-        result = _sanitize_filename("山田商事株式会社")
-        assert result == "山田商事株式会社"
-
-    def test_truncates_long_names(self) -> None:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("Normal Text", "Normal Text"),
+            ("山田商事株式会社", "山田商事株式会社"),
+            ("  Test  ", "Test"),
+            ("Test___Multiple___Underscores", "Test_Multiple_Underscores"),
+            ("__Test__", "Test"),
+        ],
+        ids=["basic", "japanese", "whitespace", "multiple-underscores", "edge-underscores"],
+    )
+    def test_sanitized_value(self, value: str, expected: str) -> None:
+        """Test clean values are kept and whitespace/underscores are normalized."""
+        assert _sanitize_filename(value) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        ['File<>:"/\\|?*Name', "Test\x00\x1fName", "Test\x7fName", "山田<商事>"],
+        ids=["invalid", "control", "delete", "japanese-invalid"],
+    )
+    def test_removes_invalid_characters(self, value: str) -> None:
+        """Test removal of invalid and control characters."""
+        assert _INVALID_CHARS.isdisjoint(_sanitize_filename(value))
+
+    @pytest.mark.parametrize("max_length", [1, 10, 50])
+    def test_truncates_long_names(self, max_length: int) -> None:
         """Test truncation of long names."""
-        long_name = "A" * 100
-        result = _sanitize_filename(long_name, max_length=50)
-        assert len(result) <= 50
-
-    def test_removes_multiple_underscores(self) -> None:
-        """Test removal of consecutive underscores."""
-        result = _sanitize_filename("Test___Multiple___Underscores")
-        assert "___" not in result
-
-    def test_strips_leading_trailing_underscores(self) -> None:
-        """Test stripping of leading/trailing underscores."""
-        result = _sanitize_filename("__Test__")
-        assert not result.startswith("_")
-        assert not result.endswith("_")
-
-    def test_strips_whitespace(self) -> None:
-        """Test stripping of whitespace."""
-        result = _sanitize_filename("  Test  ")
-        assert result == "Test"
-
-    def test_removes_control_characters(self) -> None:
-        """Test removal of control characters."""
-        result = _sanitize_filename("Test\x00\x1fName")
-        assert "\x00" not in result
-        assert "\x1f" not in result
+        assert len(_sanitize_filename("A" * 100, max_length=max_length)) == max_length
 
-    def test_truncate_removes_trailing_underscore(self) -> None:
+    @pytest.mark.parametrize("max_length", [5, 14, 23])
+    def test_truncate_removes_trailing_underscore(self, max_length: int) -> None:
         """Test that truncation removes trailing underscores."""
-        # Create a name where truncation would leave trailing underscore
-        result = _sanitize_filename("Test<>Name" * 10, max_length=10)
+        # "Test<>Name" sanitizes to "Test_Name", so these cuts land after an underscore
+        result = _sanitize_filename("Test<>Name" * 10, max_length=max_length)
         assert not result.endswith("_")
 
 
@@ -285,182 +295,141 @@ class TestExceptionClasses:
     def test_invalid_gcs_path_error(self) -> None:
         """Test InvalidGCSPathError."""
         error = InvalidGCSPathError("bad-path", "missing prefix")
-        assert "bad-path" in str(error)
-        assert "missing prefix" in str(error)
+        msg = str(error)
+
+        assert "bad-path" in msg
+        assert "missing prefix" in msg
 
     def test_invalid_gcs_path_error_no_reason(self) -> None:
         """Test InvalidGCSPathError without reason."""
         error = InvalidGCSPathError("bad-path")
-        assert "bad-path" in str(error)
+        msg = str(error)
+
+        assert "bad-path" in msg
         assert error.path == "bad-path"
         assert error.reason == ""
 
     def test_storage_error(self) -> None:
         """Test StorageError."""
         error = StorageError("Test storage error")
-        assert "Test storage error" in str(error)
+        msg = str(error)
+
+        assert "Test storage error" in msg
 
     def test_file_not_found_error(self) -> None:
         """Test FileNotFoundError."""
         error = GCSFileNotFoundError("gs://bucket/missing.pdf")
-        assert "gs://bucket/missing.pdf" in str(error)
+        msg = str(error)
+
+        assert "gs://bucket/missing.pdf" in msg
         assert error.path == "gs://bucket/missing.pdf"
 
+    @pytest.mark.parametrize(
+        "error",
+        [InvalidGCSPathError("bad-path", "missing prefix"), GCSFileNotFoundError("gs://b/f.pdf")],
+    )
+    def test_slotted_errors_survive_pickling(self, error: StorageError) -> None:
+        """Test slotted exceptions keep their attributes across pickling."""
+        restored = pickle.loads(pickle.dumps(error))  # noqa: S301
+
+        assert str(restored) == str(error)
+        assert restored.path == error.path
+        assert getattr(restored, "reason", None) == getattr(error, "reason", None)
+
 
 class TestCopyBlob:
     """Tests for copy_blob function."""
 
-    def test_copy_blob_success(self) -> None:
+    def test_copy_blob_success(self, blob_chain: BlobChainFactory) -> None:
         """Test successful blob copy."""
-        mock_client = MagicMock()
-        mock_source_bucket = MagicMock()
-        mock_dest_bucket = MagicMock()
-        mock_source_blob = MagicMock()
-        mock_dest_blob = MagicMock()
-
-        mock_client.bucket.side_effect = [mock_source_bucket, mock_dest_bucket]
-        mock_source_bucket.blob.return_value = mock_source_blob
-        mock_dest_bucket.blob.return_value = mock_dest_blob
-        mock_source_blob.exists.return_value = True
-        mock_dest_blob.rewrite.return_value = (None, 1000, 1000)  # Complete in one call
+        # Rewrite completes in one call by default
+        client, _, dest_blob = blob_chain()
 
         copy_blob(
-            mock_client,
+            client,
             "gs://source-bucket/source.pdf",
             "gs://dest-bucket/dest.pdf",
         )
 
-        mock_dest_blob.rewrite.assert_called_once()
+        dest_blob.rewrite.assert_called_once()
 
-    def test_copy_blob_with_progress(self) -> None:
+    def test_copy_blob_with_progress(self, blob_chain: BlobChainFactory) -> None:
         """Test blob copy with multiple rewrite calls (large file)."""
-        mock_client = MagicMock()
-        mock_source_bucket = MagicMock()
-        mock_dest_bucket = MagicMock()
-        mock_source_blob = MagicMock()
-        mock_dest_blob = MagicMock()
-
-        mock_client.bucket.side_effect = [mock_source_bucket, mock_dest_bucket]
-        mock_source_bucket.blob.return_value = mock_source_blob
-        mock_dest_bucket.blob.return_value = mock_dest_blob
-        mock_source_blob.exists.return_value = True
         # Simulate multi-part rewrite
-        mock_dest_blob.rewrite.side_effect = [
-            ("token1", 500, 1000),
-            ("token2", 800, 1000),
-            (None, 1000, 1000),  # Complete
-        ]
+        client, _, dest_blob = blob_chain(
+            rewrite=iter(
+                [
+                    ("token1", 500, 1000),
+                    ("token2", 800, 1000),
+                    (None, 1000, 1000),  # Complete
+                ]
+            )
+        )
 
         copy_blob(
-            mock_client,
+            client,
             "gs://source-bucket/large.pdf",
             "gs://dest-bucket/large.pdf",
         )
 
-        assert mock_dest_blob.rewrite.call_count == 3
+        assert dest_blob.rewrite.call_count == 3
 
-    def test_copy_blob_source_not_found(self) -> None:
+    def test_copy_blob_source_not_found(self, blob_chain: BlobChainFactory) -> None:
         """Test copy_blob raises FileNotFoundError when source doesn't exist."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.exists.return_value = False
+        client, _, dest_blob = blob_chain(exists=False)
 
         with pytest.raises(GCSFileNotFoundError):
             copy_blob(
-                mock_client,
+                client,
                 "gs://bucket/missing.pdf",
                 "gs://bucket/dest.pdf",
             )
 
-    def test_copy_blob_not_found_exception(self) -> None:
+        dest_blob.rewrite.assert_not_called()
+
+    def test_copy_blob_not_found_exception(self, blob_chain: BlobChainFactory) -> None:
         """Test copy_blob handles NotFound exception."""
-        mock_client = MagicMock()
-        mock_source_bucket = MagicMock()
-        mock_dest_bucket = MagicMock()
-        mock_source_blob = MagicMock()
-        mock_dest_blob = MagicMock()
-
-        mock_client.bucket.side_effect = [mock_source_bucket, mock_dest_bucket]
-        mock_source_bucket.blob.return_value = mock_source_blob
-        mock_dest_bucket.blob.return_value = mock_dest_blob
-        mock_source_blob.exists.return_value = True
-        mock_dest_blob.rewrite.side_effect = NotFound("Not found")
+        client, _, _ = blob_chain(rewrite=NotFound("Not found"))
 
         with pytest.raises(GCSFileNotFoundError):
             copy_blob(
-                mock_client,
+                client,
                 "gs://bucket/source.pdf",
                 "gs://bucket/dest.pdf",
             )
 
-    def test_copy_blob_google_api_error(self) -> None:
+    def test_copy_blob_google_api_error(self, blob_chain: BlobChainFactory) -> None:
         """Test copy_blob handles GoogleAPIError."""
-        mock_client = MagicMock()
-        mock_source_bucket = MagicMock()
-        mock_dest_bucket = MagicMock()
-        mock_source_blob = MagicMock()
-        mock_dest_blob = MagicMock()
-
-        mock_client.bucket.side_effect = [mock_source_bucket, mock_dest_bucket]
-        mock_source_bucket.blob.return_value = mock_source_blob
-        mock_dest_bucket.blob.return_value = mock_dest_blob
-        mock_source_blob.exists.return_value = True
-        mock_dest_blob.rewrite.side_effect = GoogleAPIError("API error")
+        client, _, _ = blob_chain(rewrite=GoogleAPIError("API error"))
 
-        with pytest.raises(StorageError) as exc_info:
+        with pytest.raises(StorageError, match="Failed to copy"):
             copy_blob(
-                mock_client,
+                client,
                 "gs://bucket/source.pdf",
                 "gs://bucket/dest.pdf",
             )
 
-        assert "Failed to copy" in str(exc_info.value)
-
-    def test_copy_blob_with_custom_retry(self) -> None:
+    def test_copy_blob_with_custom_retry(self, blob_chain: BlobChainFactory) -> None:
         """Test copy_blob with custom retry config."""
-        mock_client = MagicMock()
-        mock_source_bucket = MagicMock()
-        mock_dest_bucket = MagicMock()
-        mock_source_blob = MagicMock()
-        mock_dest_blob = MagicMock()
-        mock_retry = MagicMock()
-
-        mock_client.bucket.side_effect = [mock_source_bucket, mock_dest_bucket]
-        mock_source_bucket.blob.return_value = mock_source_blob
-        mock_dest_bucket.blob.return_value = mock_dest_blob
-        mock_source_blob.exists.return_value = True
-        mock_dest_blob.rewrite.return_value = (None, 1000, 1000)
+        client, source_blob, dest_blob = blob_chain()
+        mock_retry = Mock()
 
         copy_blob(
-            mock_client,
+            client,
             "gs://bucket/source.pdf",
             "gs://bucket/dest.pdf",
             retry_config=mock_retry,
         )
 
-        mock_dest_blob.rewrite.assert_called_once()
+        dest_blob.rewrite.assert_called_once_with(source_blob, token=None, retry=mock_retry)
 
-    def test_copy_blob_zero_total_bytes(self) -> None:
+    def test_copy_blob_zero_total_bytes(self, blob_chain: BlobChainFactory) -> None:
         """Test copy_blob handles zero total bytes (empty file)."""
-        mock_client = MagicMock()
-        mock_source_bucket = MagicMock()
-        mock_dest_bucket = MagicMock()
-        mock_source_blob = MagicMock()
-        mock_dest_blob = MagicMock()
-
-        mock_client.bucket.side_effect = [mock_source_bucket, mock_dest_bucket]
-        mock_source_bucket.blob.return_value = mock_source_blob
-        mock_dest_bucket.blob.return_value = mock_dest_blob
-        mock_source_blob.exists.return_value = True
-        mock_dest_blob.rewrite.return_value = (None, 0, 0)
+        client, _, _ = blob_chain(rewrite=(None, 0, 0))
 
         # Should not raise division by zero
         copy_blob(
-            mock_client,
+            client,
             "gs://bucket/empty.pdf",
             "gs://bucket/dest.pdf",
         )
@@ -469,124 +438,181 @@ class TestCopyBlob:
 class TestDeleteBlob:
     """Tests for delete_blob function."""
 
-    def test_delete_blob_success(self) -> None:
+    def test_delete_blob_success(self, gcs_mocks: SimpleNamespace) -> None:
         """Test successful blob deletion."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-
-        result = delete_blob(mock_client, "gs://bucket/file.pdf")
+        result = delete_blob(gcs_mocks.client, "gs://bucket/file.pdf")
 
         assert result is True
-        mock_blob.delete.assert_called_once()
+        gcs_mocks.blob.delete.assert_called_once()
 
-    def test_delete_blob_not_found_ignored(self) -> None:
+    def test_delete_blob_not_found_ignored(self, gcs_mocks: SimpleNamespace) -> None:
         """Test delete_blob with ignore_not_found=True (default)."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.delete.side_effect = NotFound("Not found")
+        gcs_mocks.blob.delete.side_effect = NotFound("Not found")
 
-        result = delete_blob(mock_client, "gs://bucket/missing.pdf")
+        result = delete_blob(gcs_mocks.client, "gs://bucket/missing.pdf")
 
         assert result is False
 
-    def test_delete_blob_not_found_raises(self) -> None:
+    def test_delete_blob_not_found_raises(self, gcs_mocks: SimpleNamespace) -> None:
         """Test delete_blob with ignore_not_found=False."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.delete.side_effect = NotFound("Not found")
+        gcs_mocks.blob.delete.side_effect = NotFound("Not found")
 
         with pytest.raises(GCSFileNotFoundError):
-            delete_blob(mock_client, "gs://bucket/missing.pdf", ignore_not_found=False)
+            delete_blob(gcs_mocks.client, "gs://bucket/missing.pdf", ignore_not_found=False)
 
-    def test_delete_blob_google_api_error(self) -> None:
+    def test_delete_blob_google_api_error(self, gcs_mocks: SimpleNamespace) -> None:
         """Test delete_blob handles GoogleAPIError."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.delete.side_effect = GoogleAPIError("API error")
+        gcs_mocks.blob.delete.side_effect = GoogleAPIError("API error")
 
-        with pytest.raises(StorageError) as exc_info:
-            delete_blob(mock_client, "gs://bucket/file.pdf")
-
-        assert "Failed to delete" in str(exc_info.value)
+        with pytest.raises(StorageError, match="Failed to delete"):
+            delete_blob(gcs_mocks.client, "gs://bucket/file.pdf")
 
-    def test_delete_blob_with_custom_retry(self) -> None:
+    def test_delete_blob_with_custom_retry(self, gcs_mocks: SimpleNamespace) -> None:
         """Test delete_blob with custom retry config."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        mock_retry = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
+        mock_retry = Mock()
 
         result = delete_blob(
-            mock_client,
+            gcs_mocks.client,
             "gs://bucket/file.pdf",
             retry_config=mock_retry,
         )
 
         assert result is True
-        mock_blob.delete.assert_called_once_with(retry=mock_retry)
+        gcs_mocks.blob.delete.assert_called_once_with(retry=mock_retry)
+
+
+class TestCopyBlobsBatch:
+    """Tests for copy_blobs_batch function."""
+
+    def test_copy_blobs_batch_success(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test every pair is copied."""
+        gcs_mocks.blob.exists.return_value = True
+        gcs_mocks.blob.rewrite.return_value = (None, 1000, 1000)
+
+        copy_blobs_batch(
+            gcs_mocks.client,
+            [(f"gs://bucket/src{i}.pdf", f"gs://bucket/dst{i}.pdf") for i in range(3)],
+            max_workers=2,
+        )
+
+        assert gcs_mocks.blob.rewrite.call_count == 3
+
+    def test_copy_blobs_batch_reuses_bucket_handle(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test a batch within one bucket creates a single bucket handle."""
+        gcs_mocks.blob.exists.return_value = True
+        gcs_mocks.blob.rewrite.return_value = (None, 1000, 1000)
+
+        copy_blobs_batch(
+            gcs_mocks.client,
+            [(f"gs://bucket/src{i}.pdf", f"gs://bucket/dst{i}.pdf") for i in range(3)],
+            max_workers=1,
+        )
+
+        gcs_mocks.client.bucket.assert_called_once_with("bucket")
+
+    def test_copy_blobs_batch_empty(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test empty batch makes no GCS calls."""
+        copy_blobs_batch(gcs_mocks.client, [])
+
+        gcs_mocks.client.bucket.assert_not_called()
+
+    def test_copy_blobs_batch_aggregates_failures(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test failed copies are reported together in one StorageError."""
+        gcs_mocks.blob.exists.return_value = False
+
+        with pytest.raises(StorageError) as exc_info:
+            copy_blobs_batch(
+                gcs_mocks.client,
+                [
+                    ("gs://bucket/a.pdf", "gs://bucket/x.pdf"),
+                    ("gs://bucket/b.pdf", "gs://bucket/y.pdf"),
+                ],
+            )
+
+        message = str(exc_info.value)
+        assert "Failed to copy 2 of 2 blobs" in message
+        assert "gs://bucket/a.pdf -> gs://bucket/x.pdf" in message
+        assert "gs://bucket/b.pdf -> gs://bucket/y.pdf" in message
+        assert isinstance(exc_info.value.__cause__, GCSFileNotFoundError)
+
+
+class TestDeleteBlobsBatch:
+    """Tests for delete_blobs_batch function."""
+
+    def test_delete_blobs_batch_success(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test every path is deleted and results keep input order."""
+        paths = [f"gs://bucket/file{i}.pdf" for i in range(3)]
+
+        result = delete_blobs_batch(gcs_mocks.client, paths, max_workers=2)
+
+        assert result == [True, True, True]
+        assert gcs_mocks.blob.delete.call_count == 3
+
+    def test_delete_blobs_batch_not_found_ignored(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test missing blobs are reported as False, not failures."""
+        gcs_mocks.blob.delete.side_effect = NotFound("Not found")
+
+        result = delete_blobs_batch(gcs_mocks.client, ["gs://bucket/a.pdf", "gs://bucket/b.pdf"])
+
+        assert result == [False, False]
+
+    def test_delete_blobs_batch_aggregates_failures(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test failed deletes are reported together in one StorageError."""
+        gcs_mocks.blob.delete.side_effect = GoogleAPIError("API error")
+
+        with pytest.raises(StorageError) as exc_info:
+            delete_blobs_batch(gcs_mocks.client, ["gs://bucket/a.pdf", "gs://bucket/b.pdf"])
+
+        message = str(exc_info.value)
+        assert "Failed to delete 2 of 2 blobs" in message
+        assert "gs://bucket/a.pdf" in message
+        assert "gs://bucket/b.pdf" in message
 
 
 class TestFileExists:
     """Tests for file_exists function."""
 
-    def test_file_exists_true(self) -> None:
+    def test_file_exists_true(self, gcs_mocks: SimpleNamespace) -> None:
         """Test file_exists returns True when file exists."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.exists.return_value = True
+        gcs_mocks.blob.exists.return_value = True
 
-        result = file_exists(mock_client, "gs://bucket/existing.pdf")
+        result = file_exists(gcs_mocks.client, "gs://bucket/existing.pdf")
 
         assert result is True
 
-    def test_file_exists_false(self) -> None:
+    def test_file_exists_false(self, gcs_mocks: SimpleNamespace) -> None:
         """Test file_exists returns False when file doesn't exist."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.exists.return_value = False
+        gcs_mocks.blob.exists.return_value = False
 
-        result = file_exists(mock_client, "gs://bucket/missing.pdf")
+        result = file_exists(gcs_mocks.client, "gs://bucket/missing.pdf")
 
         assert result is False
 
-    def test_file_exists_api_error_returns_false(self) -> None:
-        """Test file_exists returns False on API error."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
+    def test_file_exists_cached(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test repeated checks sharing a cache hit GCS only once."""
+        gcs_mocks.blob.exists.return_value = True
+        cache: dict[str, bool] = {}
+
+        first = file_exists(gcs_mocks.client, "gs://bucket/file.pdf", cache=cache)
+        second = file_exists(gcs_mocks.client, "gs://bucket/file.pdf", cache=cache)
 
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.exists.side_effect = GoogleAPIError("API error")
+        assert first is second is True
+        gcs_mocks.blob.exists.assert_called_once()
+        assert cache == {"gs://bucket/file.pdf": True}
 
-        result = file_exists(mock_client, "gs://bucket/file.pdf")
+    def test_file_exists_api_error_not_cached(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test failed checks are not memoized."""
+        gcs_mocks.blob.exists.side_effect = GoogleAPIError("API error")
+        cache: dict[str, bool] = {}
+
+        assert file_exists(gcs_mocks.client, "gs://bucket/file.pdf", cache=cache) is False
+        assert cache == {}
+
+    def test_file_exists_api_error_returns_false(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test file_exists returns False on API error."""
+        gcs_mocks.blob.exists.side_effect = GoogleAPIError("API error")
+
+        result = file_exists(gcs_mocks.client, "gs://bucket/file.pdf")
 
         assert result is False
 
@@ -594,334 +620,327 @@ class TestFileExists:
 class TestUploadString:
     """Tests for upload_string function."""
 
-    def test_upload_string_success(self) -> None:
+    def test_upload_string_success(self, gcs_mocks: SimpleNamespace) -> None:
         """Test successful string upload."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
+        upload_string(gcs_mocks.client, "gs://bucket/test.txt", "Hello, World!")
 
-        upload_string(mock_client, "gs://bucket/test.txt", "Hello, World!")
-
-        mock_blob.upload_from_string.assert_called_once_with(
+        gcs_mocks.blob.upload_from_string.assert_called_once_with(
             "Hello, World!", content_type="text/plain"
         )
 
-    def test_upload_string_with_content_type(self) -> None:
-        """Test string upload with custom content type."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
+    def test_upload_bytes_success(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test bytes are uploaded as-is without re-encoding."""
+        payload = '{"key": "値"}'.encode()
 
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
+        upload_string(gcs_mocks.client, "gs://bucket/data.json", payload, "application/json")
 
+        uploaded = gcs_mocks.blob.upload_from_string.call_args.args[0]
+        assert uploaded is payload
+        assert gcs_mocks.blob.upload_from_string.call_args.kwargs == {
+            "content_type": "application/json"
+        }
+
+    def test_upload_string_with_content_type(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test string upload with custom content type."""
         upload_string(
-            mock_client,
+            gcs_mocks.client,
             "gs://bucket/data.json",
             '{"key": "value"}',
             content_type="application/json",
         )
 
-        mock_blob.upload_from_string.assert_called_once_with(
+        gcs_mocks.blob.upload_from_string.assert_called_once_with(
             '{"key": "value"}', content_type="application/json"
         )
 
-    def test_upload_string_google_api_error(self) -> None:
+    def test_upload_string_google_api_error(self, gcs_mocks: SimpleNamespace) -> None:
         """Test upload_string handles GoogleAPIError."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
+        gcs_mocks.blob.upload_from_string.side_effect = GoogleAPIError("API error")
 
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.upload_from_string.side_effect = GoogleAPIError("API error")
-
-        with pytest.raises(StorageError) as exc_info:
-            upload_string(mock_client, "gs://bucket/test.txt", "content")
-
-        assert "Failed to upload" in str(exc_info.value)
+        with pytest.raises(StorageError, match="Failed to upload"):
+            upload_string(gcs_mocks.client, "gs://bucket/test.txt", "content")
 
 
 class TestDownloadAsBytes:
     """Tests for download_as_bytes function."""
 
-    def test_download_as_bytes_success(self) -> None:
+    def test_download_as_bytes_success(self, gcs_mocks: SimpleNamespace) -> None:
         """Test successful bytes download."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
+        gcs_mocks.blob.exists.return_value = True
+        gcs_mocks.blob.download_as_bytes.return_value = b"Hello, World!"
 
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.exists.return_value = True
-        mock_blob.download_as_bytes.return_value = b"Hello, World!"
-
-        result = download_as_bytes(mock_client, "gs://bucket/test.txt")
+        result = download_as_bytes(gcs_mocks.client, "gs://bucket/test.txt")
 
         assert result == b"Hello, World!"
 
-    def test_download_as_bytes_not_found(self) -> None:
+    def test_download_as_bytes_not_found(self, gcs_mocks: SimpleNamespace) -> None:
         """Test download_as_bytes raises FileNotFoundError when file missing."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.exists.return_value = False
+        gcs_mocks.blob.exists.return_value = False
 
         with pytest.raises(GCSFileNotFoundError):
-            download_as_bytes(mock_client, "gs://bucket/missing.txt")
+            download_as_bytes(gcs_mocks.client, "gs://bucket/missing.txt")
 
-    def test_download_as_bytes_not_found_exception(self) -> None:
+    def test_download_as_bytes_not_found_exception(self, gcs_mocks: SimpleNamespace) -> None:
         """Test download_as_bytes handles NotFound exception."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.exists.return_value = True
-        mock_blob.download_as_bytes.side_effect = NotFound("Not found")
+        gcs_mocks.blob.exists.return_value = True
+        gcs_mocks.blob.download_as_bytes.side_effect = NotFound("Not found")
 
         with pytest.raises(GCSFileNotFoundError):
-            download_as_bytes(mock_client, "gs://bucket/missing.txt")
+            download_as_bytes(gcs_mocks.client, "gs://bucket/missing.txt")
 
-    def test_download_as_bytes_google_api_error(self) -> None:
+    def test_download_as_bytes_google_api_error(self, gcs_mocks: SimpleNamespace) -> None:
         """Test download_as_bytes handles GoogleAPIError."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.exists.return_value = True
-        mock_blob.download_as_bytes.side_effect = GoogleAPIError("API error")
+        gcs_mocks.blob.exists.return_value = True
+        gcs_mocks.blob.download_as_bytes.side_effect = GoogleAPIError("API error")
 
-        with pytest.raises(StorageError) as exc_info:
-            download_as_bytes(mock_client, "gs://bucket/file.txt")
-
-        assert "Failed to download" in str(exc_info.value)
+        with pytest.raises(StorageError, match="Failed to download"):
+            download_as_bytes(gcs_mocks.client, "gs://bucket/file.txt")
 
 
 class TestListBlobs:
     """Tests for list_blobs function."""
 
-    def test_list_blobs_success(self) -> None:
+    def test_list_blobs_success(self, gcs_mocks: SimpleNamespace) -> None:
         """Test successful blob listing."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob1 = MagicMock()
-        mock_blob2 = MagicMock()
-        mock_blob1.name = "file1.pdf"
-        mock_blob2.name = "file2.pdf"
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.list_blobs.return_value = [mock_blob1, mock_blob2]
+        gcs_mocks.bucket.list_blobs.return_value = [
+            SimpleNamespace(name="file1.pdf"),
+            SimpleNamespace(name="file2.pdf"),
+        ]
 
-        result = list_blobs(mock_client, "my-bucket")
+        result = list_blobs(gcs_mocks.client, "my-bucket")
 
         assert result == ["file1.pdf", "file2.pdf"]
 
-    def test_list_blobs_with_prefix(self) -> None:
+    def test_list_blobs_with_prefix(self, gcs_mocks: SimpleNamespace) -> None:
         """Test blob listing with prefix."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        mock_blob.name = "202501/test.pdf"
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.list_blobs.return_value = [mock_blob]
+        gcs_mocks.bucket.list_blobs.return_value = [SimpleNamespace(name="202501/test.pdf")]
 
-        result = list_blobs(mock_client, "my-bucket", prefix="202501/")
+        result = list_blobs(gcs_mocks.client, "my-bucket", prefix="202501/")
 
-        mock_bucket.list_blobs.assert_called_once_with(prefix="202501/", max_results=None)
+        gcs_mocks.bucket.list_blobs.assert_called_once_with(prefix="202501/", max_results=None)
         assert result == ["202501/test.pdf"]
 
-    def test_list_blobs_with_max_results(self) -> None:
+    def test_list_blobs_with_max_results(self, gcs_mocks: SimpleNamespace) -> None:
         """Test blob listing with max_results."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        mock_blob.name = "file.pdf"
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.list_blobs.return_value = [mock_blob]
+        gcs_mocks.bucket.list_blobs.return_value = [SimpleNamespace(name="file.pdf")]
 
-        result = list_blobs(mock_client, "my-bucket", max_results=10)
+        result = list_blobs(gcs_mocks.client, "my-bucket", max_results=10)
 
-        mock_bucket.list_blobs.assert_called_once_with(prefix="", max_results=10)
+        gcs_mocks.bucket.list_blobs.assert_called_once_with(prefix="", max_results=10)
         assert result == ["file.pdf"]
 
-    def test_list_blobs_empty(self) -> None:
+    def test_list_blobs_empty(self, gcs_mocks: SimpleNamespace) -> None:
         """Test blob listing with no results."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
+        gcs_mocks.bucket.list_blobs.return_value = []
 
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.list_blobs.return_value = []
-
-        result = list_blobs(mock_client, "my-bucket")
+        result = list_blobs(gcs_mocks.client, "my-bucket")
 
         assert result == []
 
-    def test_list_blobs_google_api_error(self) -> None:
+    def test_list_blobs_google_api_error(self, gcs_mocks: SimpleNamespace) -> None:
         """Test list_blobs handles GoogleAPIError."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.list_blobs.side_effect = GoogleAPIError("API error")
+        gcs_mocks.bucket.list_blobs.side_effect = GoogleAPIError("API error")
 
-        with pytest.raises(StorageError) as exc_info:
-            list_blobs(mock_client, "my-bucket")
+        with pytest.raises(StorageError, match="Failed to list blobs"):
+            list_blobs(gcs_mocks.client, "my-bucket")
 
-        assert "Failed to list blobs" in str(exc_info.value)
 
+class TestListBlobsIter:
+    """Tests for list_blobs_iter function."""
 
-class TestStorageClient:
-    """Tests for StorageClient class."""
+    def test_list_blobs_iter_is_lazy(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test names are pulled from the listing only as they are consumed."""
+        consumed: list[str] = []
 
-    def test_storage_client_init_with_client(self) -> None:
-        """Test StorageClient initialization with existing client."""
-        mock_client = MagicMock()
+        def _pages():
+            for name in ("file1.pdf", "file2.pdf", "file3.pdf"):
+                consumed.append(name)
+                yield SimpleNamespace(name=name)
 
-        storage_client = StorageClient(client=mock_client)
+        gcs_mocks.bucket.list_blobs.return_value = _pages()
 
-        assert storage_client.client == mock_client
+        names = list_blobs_iter(gcs_mocks.client, "my-bucket")
 
-    def test_storage_client_init_without_client(self) -> None:
-        """Test StorageClient initialization without client."""
-        with patch("src.core.storage.storage.Client") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client_class.return_value = mock_client
+        assert consumed == []
+        assert next(names) == "file1.pdf"
+        assert consumed == ["file1.pdf"]
+        assert list(names) == ["file2.pdf", "file3.pdf"]
 
-            storage_client = StorageClient()
+    def test_list_blobs_iter_google_api_error(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test errors raised mid-listing surface as StorageError."""
 
-            assert storage_client._client is not None
+        def _pages():
+            yield SimpleNamespace(name="file1.pdf")
+            raise GoogleAPIError("API error")
 
-    def test_storage_client_copy_file(self) -> None:
-        """Test StorageClient.copy_file method."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_source_blob = MagicMock()
-        mock_dest_blob = MagicMock()
+        gcs_mocks.bucket.list_blobs.return_value = _pages()
+        names = list_blobs_iter(gcs_mocks.client, "my-bucket")
 
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_source_blob
-        mock_source_blob.exists.return_value = True
-        mock_dest_blob.rewrite.return_value = (None, 1000, 1000)
+        assert next(names) == "file1.pdf"
+        with pytest.raises(StorageError, match="Failed to list blobs"):
+            next(names)
 
-        # Configure mock to return different blobs for source and dest
-        mock_client.bucket.side_effect = [mock_bucket, mock_bucket]
-        mock_bucket.blob.side_effect = [mock_source_blob, mock_dest_blob]
 
-        storage_client = StorageClient(client=mock_client)
-        storage_client.copy_file(
-            "gs://bucket/source.pdf",
-            "gs://bucket/dest.pdf",
-        )
+class TestStorageClient:
+    """Tests for StorageClient class."""
 
-        mock_dest_blob.rewrite.assert_called_once()
+    @pytest.fixture(scope="class")
+    def storage_client(self, _gcs_mock_tree: SimpleNamespace) -> Iterator[StorageClient]:
+        """StorageClient shared by the class, wrapping the class's GCS mock tree.
 
-    def test_storage_client_delete_file(self) -> None:
-        """Test StorageClient.delete_file method."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
+        Its bucket handle cache persists across tests, so only the first test to
+        touch a bucket sees ``client.bucket`` called. Tests that assert on
+        ``client.bucket`` build their own StorageClient instead.
+        """
+        storage_client = StorageClient(client=_gcs_mock_tree.client)
+        yield storage_client
+        storage_client.close()
 
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
+    def test_storage_client_init_with_client(self) -> None:
+        """Test StorageClient initialization with existing client."""
+        mock_client = Mock()
 
         storage_client = StorageClient(client=mock_client)
-        result = storage_client.delete_file("gs://bucket/file.pdf")
-
-        assert result is True
-        mock_blob.delete.assert_called_once()
-
-    def test_storage_client_delete_file_ignore_not_found(self) -> None:
-        """Test StorageClient.delete_file with ignore_not_found."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.delete.side_effect = NotFound("Not found")
 
-        storage_client = StorageClient(client=mock_client)
-        result = storage_client.delete_file("gs://bucket/file.pdf", ignore_not_found=True)
+        assert storage_client.client == mock_client
 
-        assert result is False
+    def test_storage_client_init_without_client(self) -> None:
+        """Test StorageClient initialization without client."""
+        with patch("src.core.storage.storage.Client") as mock_client_class:
+            mock_client_class.return_value = Mock()
 
-    def test_storage_client_file_exists(self) -> None:
-        """Test StorageClient.file_exists method."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
+            storage_client = StorageClient()
 
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.exists.return_value = True
+            assert storage_client._client is not None
 
-        storage_client = StorageClient(client=mock_client)
-        result = storage_client.file_exists("gs://bucket/file.pdf")
+    def test_storage_client_reuses_bucket_handle(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test repeated operations on one bucket create a single bucket handle."""
+        storage_client = StorageClient(client=gcs_mocks.client)
 
-        assert result is True
+        storage_client.file_exists("gs://bucket/a.pdf")
+        storage_client.file_exists("gs://bucket/b.pdf")
 
-    def test_storage_client_generate_destination_path(self) -> None:
-        """Test StorageClient.generate_destination_path method."""
-        mock_client = MagicMock()
+        gcs_mocks.client.bucket.assert_called_once_with("bucket")
 
-        storage_client = StorageClient(client=mock_client)
-        result = storage_client.generate_destination_path(
-            {
-                "document_id": "ID-001",
-                "management_id": "ID-001",
-                "company_name": "Test Co",
-                "issue_date": "2025-01-15",
-                "document_type": "delivery_note",
-            },
-            datetime(2025, 1, 15, tzinfo=UTC),
-            "output-bucket",
-        )
+    def test_storage_client_close_clears_bucket_cache(self, gcs_mocks: SimpleNamespace) -> None:
+        """Test close() drops cached bucket handles."""
+        storage_client = StorageClient(client=gcs_mocks.client)
 
-        assert "gs://output-bucket/202501/" in result
-        assert "ID-001" in result
-        assert "Test_Co" in result
+        storage_client.file_exists("gs://bucket/a.pdf")
+        storage_client.close()
+        storage_client.file_exists("gs://bucket/a.pdf")
 
-    def test_storage_client_upload_string(self) -> None:
-        """Test StorageClient.upload_string method."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
+        assert gcs_mocks.client.bucket.call_count == 2
 
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
+    def test_storage_client_close_keeps_other_clients_handles(self) -> None:
+        """Test close() only drops the closing instance's bucket handles."""
+        first, second = StorageClient(client=Mock()), StorageClient(client=Mock())
+        first.file_exists("gs://bucket/a.pdf")
+        second.file_exists("gs://bucket/a.pdf")
 
-        storage_client = StorageClient(client=mock_client)
-        storage_client.upload_string("gs://bucket/test.txt", "content", "text/plain")
+        first.close()
+        second.file_exists("gs://bucket/a.pdf")
 
-        mock_blob.upload_from_string.assert_called_once_with("content", content_type="text/plain")
+        second.client.bucket.assert_called_once_with("bucket")
 
-    def test_storage_client_download_as_bytes(self) -> None:
-        """Test StorageClient.download_as_bytes method."""
-        mock_client = MagicMock()
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
+    def test_storage_client_copy_file(self, blob_chain: BlobChainFactory) -> None:
+        """Test StorageClient.copy_file method."""
+        client, _, dest_blob = blob_chain()
 
-        mock_client.bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.exists.return_value = True
-        mock_blob.download_as_bytes.return_value = b"content"
+        storage_client = StorageClient(client=client)
+        storage_client.copy_file(
+            "gs://bucket/source.pdf",
+            "gs://bucket/dest.pdf",
+        )
 
-        storage_client = StorageClient(client=mock_client)
-        result = storage_client.download_as_bytes("gs://bucket/test.txt")
+        dest_blob.rewrite.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("method", "args", "mock_config", "expected", "expected_calls"),
+        [
+            pytest.param(
+                "delete_file",
+                ("gs://bucket/file.pdf",),
+                {},
+                True,
+                {"blob.delete": [call(retry=DEFAULT_RETRY)]},
+                id="delete_file",
+            ),
+            pytest.param(
+                "delete_file",
+                ("gs://bucket/file.pdf", True),
+                {"blob.delete.side_effect": NotFound("Not found")},
+                False,
+                {},
+                id="delete_file_ignore_not_found",
+            ),
+            pytest.param(
+                "file_exists",
+                ("gs://bucket/file.pdf",),
+                {"blob.exists.return_value": True},
+                True,
+                {},
+                id="file_exists",
+            ),
+            pytest.param(
+                "generate_destination_path",
+                (
+                    {
+                        "document_id": "ID-001",
+                        "management_id": "ID-001",
+                        "company_name": "Test Co",
+                        "issue_date": "2025-01-15",
+                        "document_type": "delivery_note",
+                    },
+                    _TS_20250115,
+                    "output-bucket",
+                ),
+                {},
+                "gs://output-bucket/202501/delivery_notes/ID-001_Test_Co_20250115.pdf",
+                {},
+                id="generate_destination_path",
+            ),
+            pytest.param(
+                "upload_string",
+                ("gs://bucket/test.txt", "content", "text/plain"),
+                {},
+                None,
+                {"blob.upload_from_string": [call("content", content_type="text/plain")]},
+                id="upload_string",
+            ),
+            pytest.param(
+                "download_as_bytes",
+                ("gs://bucket/test.txt",),
+                {
+                    "blob.exists.return_value": True,
+                    "blob.download_as_bytes.return_value": b"content",
+                },
+                b"content",
+                {},
+                id="download_as_bytes",
+            ),
+        ],
+    )
+    def test_storage_client_method(
+        self,
+        storage_client: StorageClient,
+        gcs_mocks: SimpleNamespace,
+        method: str,
+        args: tuple[Any, ...],
+        mock_config: dict[str, Any],
+        expected: Any,
+        expected_calls: dict[str, list[Any]],
+    ) -> None:
+        """Test StorageClient methods delegate to the module functions."""
+        for path, value in mock_config.items():
+            owner, _, attr = path.rpartition(".")
+            setattr(attrgetter(owner)(gcs_mocks), attr, value)
+
+        result = getattr(storage_client, method)(*args)
 
-        assert result == b"content"
+        assert result == expected
+        for path, calls in expected_calls.items():
+            assert attrgetter(path)(gcs_mocks).call_args_list == calls
 
 
 class TestDefaultRetry: